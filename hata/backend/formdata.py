@@ -259,6 +259,34 @@ class Formdata(object):
         else:
             return self._gen_form_urlencoded(encoding)
     
+    def add_json_field(self, name, data, default=None):
+        """
+        Adds a json field to the formdata. The data is serialized directly to `bytes` and is sent with
+        `application/json` content type, so it is not re-encoded when the payload is generated.
+        
+        Parameters
+        ----------
+        name : `str`
+            The field's name.
+        data : `Any`
+            Json serializable content.
+        default : `None` or `callable`, Optional
+            Called with the objects, which cannot be serialized otherwise. Defaults to `None`.
+        
+        Raises
+        ------
+        TypeError
+            If `data` is not json serializable.
+        """
+        type_options = multidict()
+        type_options['name'] = name
+        
+        headers = {CONTENT_TYPE: 'application/json'}
+        data = dump_to_json(data, separators=(',', ':'), ensure_ascii=True, default=default).encode()
+        
+        self.fields.append((type_options, headers, data))
+        self.is_multipart = True
+    
     def add_json(self, data):
         """
         Shortcut to add a json field to the ``Formdata``.
@@ -5880,6 +5880,8 @@ class WaitContinously(WaitTillFirst):
             
             if future.done():
                 self._result[0].add(future)
+                if self._last_done is None:
+                    self._last_done = future
                 return
             
             pending = self._result[1]
@@ -5888,7 +5890,9 @@ class WaitContinously(WaitTillFirst):
             if pending_count != len(pending):
                 future.add_done_callback(self._callback)
             
-            self._state = PENDING
+            # If a done future is still waiting to be yielded, we stay finished.
+            if self._last_done is None:
+                self._state = PENDING
             return
         
         if __debug__:
@@ -6083,6 +6087,7 @@ class WaitContinously(WaitTillFirst):
                 self._last_done = done.pop()
                 return 3
             
+            self._last_done = None
             if pending:
                 self._state = PENDING
                 return 2
@@ -6107,6 +6112,7 @@ class WaitContinously(WaitTillFirst):
                     self._last_done = done.pop()
                     return 3
                 
+                self._last_done = None
                 if pending:
                     self._state = PENDING
                     return 2
@@ -714,10 +714,25 @@ class ChannelTextBase:
         Returns and accepts an `int`.
         """)
     
+    def _as_target(self):
+        """
+        Returns the target of a message create request, which is sent to the channel.
+        
+        Returns
+        -------
+        channel : ``ChannelTextBase`` instance
+            The channel itself.
+        channel_id : `int`
+            The channel's id.
+        message_id : `None`
+            The channel is not a message, so it has no message id.
+        """
+        return self, self.id, None
+    
     def _create_new_message(self, data):
         """
-        Creates a new message at the channel. If the message already exists inside of the channel's message history,
-        returns that instead.
+        Creates a new message at the channel. If the message already exists inside of the channel's message history
+        or at `MESSAGES`, returns that instead.
         
         Parameters
         ----------
@@ -749,9 +764,12 @@ class ChannelTextBase:
                 if (maxlen is not None) and (len(messages) == maxlen):
                     self.message_history_reached_end = False
         
-        message = object.__new__(Message)
-        message.id = message_id
-        message._finish_init(data, self)
+        try:
+            message = MESSAGES[message_id]
+        except KeyError:
+            message = object.__new__(Message)
+            message.id = message_id
+            message._finish_init(data, self)
         
         messages.appendleft(message)
         return message
@@ -830,9 +848,12 @@ class ChannelTextBase:
                 if (maxlen is not None) and (maxlen == len(messages)):
                     messages.pop()
         
-        message = object.__new__(Message)
-        message.id = message_id
-        message._finish_init(data, self)
+        try:
+            message = MESSAGES[message_id]
+        except KeyError:
+            message = object.__new__(Message)
+            message.id = message_id
+            message._finish_init(data, self)
         
         messages.insert(index, message)
         return message
@@ -4688,7 +4709,7 @@ def cr_pg_channel_object(name, type_, *, overwrites=None, topic=None, nsfw=None,
     
     if (topic is not None):
         if __debug__:
-            if not issubclass(channel_type, ChannelText):
+            if (channel_type is not ChannelText) and (not issubclass(channel_type, ChannelText)):
                 raise AssertionError(f'`topic` is a valid parameter only for {ChannelText.__name__} '
                     f'instances, got {channel_type.__name__}.')
             
@@ -4705,7 +4726,8 @@ def cr_pg_channel_object(name, type_, *, overwrites=None, topic=None, nsfw=None,
     
     if (nsfw is not None):
         if __debug__:
-            if not issubclass(channel_type, (ChannelText, ChannelStore)):
+            if (channel_type not in (ChannelText, ChannelStore)) and \
+                    (not issubclass(channel_type, (ChannelText, ChannelStore))):
                 raise AssertionError(f'`nsfw` is a valid parameter only for `{ChannelText.__name__}` and '
                     f'`{ChannelStore.__name__}` instances, but got {channel_type.__name__}.')
             
@@ -4717,7 +4739,7 @@ def cr_pg_channel_object(name, type_, *, overwrites=None, topic=None, nsfw=None,
     
     if (slowmode is not None):
         if __debug__:
-            if not issubclass(channel_type, ChannelText):
+            if (channel_type is not ChannelText) and (not issubclass(channel_type, ChannelText)):
                 raise AssertionError(f'`slowmode` is a valid parameter only for `{ChannelText.__name__}` instances, '
                     f'but got {channel_type.__name__}.')
             
@@ -4734,7 +4756,7 @@ def cr_pg_channel_object(name, type_, *, overwrites=None, topic=None, nsfw=None,
 
     if (bitrate is not None):
         if __debug__:
-            if not issubclass(channel_type, ChannelVoice):
+            if (channel_type is not ChannelVoice) and (not issubclass(channel_type, ChannelVoice)):
                 raise AssertionError(f'`bitrate` is a valid parameter only for `{ChannelVoice.__name__}` instances, '
                     f'but got {channel_type.__name__}.')
                 
@@ -4756,7 +4778,7 @@ def cr_pg_channel_object(name, type_, *, overwrites=None, topic=None, nsfw=None,
     
     if (user_limit is not None):
         if __debug__:
-            if not issubclass(channel_type, ChannelVoice):
+            if (channel_type is not ChannelVoice) and (not issubclass(channel_type, ChannelVoice)):
                 raise AssertionError(f'`user_limit` is a valid parameter only for `{ChannelVoice.__name__}` '
                     f'instances, but got {channel_type.__name__}.')
             
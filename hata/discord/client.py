@@ -4,23 +4,26 @@ __all__ = ('Client', )
 import re, sys, warnings
 from time import time as time_now
 from collections import deque
-from os.path import split as splitpath
+from itertools import islice
+from os.path import basename
+from secrets import token_hex
 from threading import current_thread
 from math import inf
+from operator import itemgetter
 from datetime import datetime
 
 from ..env import CACHE_USER, CACHE_PRESENCE, API_VERSION
 from ..backend.utils import imultidict, methodize, change_on_switch
-from ..backend.futures import Future, Task, sleep, CancelledError, WaitTillAll, WaitTillFirst, WaitTillExc, \
-    future_or_timeout
+from ..backend.futures import Future, Task, sleep, CancelledError, WaitTillAll, WaitTillExc, WaitContinously, \
+    future_or_timeout, ScarletExecutor, shield
 from ..backend.eventloop import EventThread, LOOP_TIME
 from ..backend.formdata import Formdata
 from ..backend.hdrs import AUTHORIZATION
 from ..backend.helpers import BasicAuth
 from ..backend.url import URL
 
-from .utils import log_time_converter, DISCORD_EPOCH, image_to_base64, random_id, to_json, RelationshipType, \
-    get_image_extension
+from .utils import log_time_converter, DISCORD_EPOCH, image_to_base64, RelationshipType, \
+    get_image_extension, added_json_serializer
 from .user import User, USERS, GuildProfile, UserBase, UserFlag, create_partial_user, GUILD_PROFILES_TYPE
 from .emoji import Emoji
 from .channel import ChannelCategory, ChannelGuildBase, ChannelPrivate, ChannelText, ChannelGroup, ChannelStore, \
@@ -52,7 +55,8 @@ from .bases import ICON_TYPE_NONE
 from .preinstanced import Status, VoiceRegion, ContentFilterLevel, PremiumType, VerificationLevel, \
     MessageNotificationLevel, HypesquadHouse
 from .client_utils import SingleUserChunker, MassUserChunker, DiscoveryCategoryRequestCacher, UserGuildPermission, \
-    DiscoveryTermRequestCacher, MultiClientMessageDeleteSequenceSharder, WaitForHandler, Typer, maybe_snowflake
+    DiscoveryTermRequestCacher, MultiClientMessageDeleteSequenceSharder, WaitForHandler, Typer, MessageCoalescer, \
+    MessageAuthorFilter, maybe_snowflake
 from .embed import EmbedBase, EmbedImage
 from .interaction import ApplicationCommand, InteractionResponseTypes
 
@@ -66,6 +70,776 @@ _VALID_NAME_CHARS = re.compile('([0-9A-Za-z_]+)')
 CHANNEL_MOVE_RESET_INDEXES = tuple(index for index, type_ in enumerate(CHANNEL_TYPES) if \
     (issubclass(type_, ChannelGuildBase) and type_ is not ChannelCategory))
 
+# Used as sort key of channel keys, sorting them by their order group.
+CHANNEL_KEY_ORDER_GROUP_GETTER = itemgetter(0)
+
+# The amount of messages deleted parallelly at private channels. Matches the size of the static message delete
+# ratelimit group, so more requests would just wait for the ratelimit.
+PRIVATE_MESSAGE_DELETE_PARALLELISM = 5
+
+# The amount of single message deletions started parallelly by `Client.message_delete_sequence` for each endpoint.
+SEQUENCE_MESSAGE_DELETE_PARALLELISM = 5
+
+# The amount of channels, from which `Client.message_delete_multiple2` deletes messages parallelly.
+MULTI_CHANNEL_MESSAGE_DELETE_PARALLELISM = 16
+
+# The builtin text channel types. Checked by exact type before falling back to `isinstance`, since channels are
+# usually passed as one of these.
+TEXT_CHANNEL_TYPES = frozenset((ChannelText, ChannelPrivate, ChannelGroup))
+
+# Allowed mentions returned when every mention is disabled. Shared, so do not modify it.
+ALLOWED_MENTIONS_NONE = {'parse': []}
+
+ALLOWED_MENTIONS_FLAG_REPLIED_USER = 0
+ALLOWED_MENTIONS_FLAG_EVERYONE = 1
+ALLOWED_MENTIONS_FLAG_USERS = 2
+ALLOWED_MENTIONS_FLAG_ROLES = 3
+
+# `str` elements accepted by `Client._parse_allowed_mentions` and the flag index - value pairs they set.
+ALLOWED_MENTIONS_STR_ELEMENTS = {
+    '!replied_user' : (ALLOWED_MENTIONS_FLAG_REPLIED_USER, -1),
+    'replied_user'  : (ALLOWED_MENTIONS_FLAG_REPLIED_USER, 1),
+    'everyone'      : (ALLOWED_MENTIONS_FLAG_EVERYONE, 1),
+    'users'         : (ALLOWED_MENTIONS_FLAG_USERS, 1),
+    'roles'         : (ALLOWED_MENTIONS_FLAG_ROLES, 1),
+        }
+
+# Allowed mentions created only from `str` elements by their flags. Shared, so do not modify them.
+ALLOWED_MENTIONS_PRESETS = {}
+
+# Millisecond offsets to subtract from the current time to get the snowflake limit of messages being 2 weeks old,
+# and of 2 weeks - 10 seconds old.
+TWO_WEEKS_SNOWFLAKE_OFFSET = 1209600000+DISCORD_EPOCH
+TWO_WEEKS_SAFE_SNOWFLAKE_OFFSET = 1209590000+DISCORD_EPOCH
+
+
+def _create_allowed_mentions(flags, allowed_users, allowed_roles):
+    """
+    Creates allowed mentions from the flags and from the users and roles collected by
+    ``Client._parse_allowed_mentions``.
+    
+    Parameters
+    ----------
+    flags : `list` or `tuple` of `int`
+        The `replied_user`, `everyone`, `users` and `roles` flags.
+    allowed_users : `None` or `list` of `int`
+        The allowed users' identificators.
+    allowed_roles : `None` or `list` of `int`
+        The allowed roles' identificators.
+    
+    Returns
+    -------
+    allowed_mentions : `dict` of (`str`, `Any`) items
+    """
+    allow_replied_user, allow_everyone, allow_users, allow_roles = flags
+    
+    result = {}
+    parse_all_of = None
+    
+    if allow_replied_user:
+        result['replied_user'] = (allow_replied_user > 0)
+    
+    if allow_everyone:
+        if parse_all_of is None:
+            parse_all_of = []
+            result['parse'] = parse_all_of
+        
+        parse_all_of.append('everyone')
+    
+    if allow_users:
+        if parse_all_of is None:
+            parse_all_of = []
+            result['parse'] = parse_all_of
+        
+        parse_all_of.append('users')
+    else:
+        if (allowed_users is not None):
+            result['users'] = allowed_users
+    
+    if allow_roles:
+        if parse_all_of is None:
+            parse_all_of = []
+            result['parse'] = parse_all_of
+        
+        parse_all_of.append('roles')
+    else:
+        if (allowed_roles is not None):
+            result['roles'] = allowed_roles
+    
+    return result
+
+
+def _encode_message_delete_multiple_data(message_ids):
+    """
+    Encodes the request data of a bulk message delete directly to json `bytes`, so it does not need to go through
+    the json encoder.
+    
+    Parameters
+    ----------
+    message_ids : `list` of `int`
+        The messages' identifiers to delete.
+    
+    Returns
+    -------
+    data : `bytes`
+    """
+    return b'{"messages":[%s]}' % ','.join([str(message_id) for message_id in message_ids]).encode('ascii')
+
+
+def _get_message_data_author_id(message_data):
+    """
+    Returns the author's id of the given message data without creating a message. Used by the delete sequence
+    methods.
+    
+    Parameters
+    ----------
+    message_data : `dict` of (`str`, `Any`) items
+        Message data received from Discord.
+    
+    Returns
+    -------
+    author_id : `int`
+        Defaults to `0` if the message data contains no author, since that is sure not the id of any client.
+    """
+    author_data = message_data.get('author', None)
+    if author_data is None:
+        return 0
+    
+    # Message authors have their `id` at the top level, so check that first and select the user's data only if missing.
+    author_id = author_data.get('id', None)
+    if author_id is None:
+        author_id = author_data.get('user', author_data).get('id', 0)
+    
+    return int(author_id)
+
+
+def _resolve_text_channel(channel):
+    """
+    Resolves the given text channel or channel identifier.
+    
+    Parameters
+    ----------
+    channel : ``ChannelTextBase`` or `int` instance
+        The channel or it's identifier.
+    
+    Returns
+    -------
+    channel : `None` or ``ChannelTextBase`` instance
+        The channel itself. Returns `None` if it was given as identifier and it is not cached.
+    channel_id : `int`
+        The channel's identifier.
+    
+    Raises
+    ------
+    TypeError
+        If `channel` was not given neither as ``ChannelTextBase`` nor `int` instance.
+    """
+    if (type(channel) in TEXT_CHANNEL_TYPES) or isinstance(channel, ChannelTextBase):
+        channel_id = channel.id
+    
+    else:
+        channel_id = maybe_snowflake(channel)
+        if channel_id is None:
+            raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` or `int` instance, got '
+                f'{channel.__class__.__name__}.')
+        
+        channel = CHANNELS.get(channel_id)
+    
+    return channel, channel_id
+
+
+def _get_text_channel_id(channel):
+    """
+    Returns the given text channel's identifier. Unlike ``_resolve_text_channel``, does not look up the channel from
+    the cache, so should be used when only the identifier is needed.
+    
+    Parameters
+    ----------
+    channel : ``ChannelTextBase`` or `int` instance
+        The channel or it's identifier.
+    
+    Returns
+    -------
+    channel_id : `int`
+        The channel's identifier.
+    
+    Raises
+    ------
+    TypeError
+        If `channel` was not given neither as ``ChannelTextBase`` nor `int` instance.
+    """
+    if (type(channel) in TEXT_CHANNEL_TYPES) or isinstance(channel, ChannelTextBase):
+        return channel.id
+    
+    channel_id = maybe_snowflake(channel)
+    if channel_id is None:
+        raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` or `int` instance, got '
+            f'{channel.__class__.__name__}.')
+    
+    return channel_id
+
+
+def _get_message_ids(message):
+    """
+    Returns the identifiers of the given message and of it's channel. Used by the reaction methods.
+    
+    Parameters
+    ----------
+    message : ``Message``, ``MessageRepr`` or ``MessageReference``
+        The message to get it's identifiers of.
+    
+    Returns
+    -------
+    channel_id : `int`
+        The message's channel's identifier.
+    message_id : `int`
+        The message's identifier.
+    reactions : `None` or ``reaction_mapping``
+        The message's reactions. Only ``Message``-s have reactions, so for the other types it is always `None`.
+    
+    Raises
+    ------
+    TypeError
+        If `message` was not given neither as ``Message``, ``MessageRepr`` nor ``MessageReference`` instance.
+    """
+    message_type = type(message)
+    if (message_type is Message) or isinstance(message, Message):
+        return message.channel.id, message.id, message.reactions
+    
+    if (message_type is MessageRepr) or isinstance(message, MessageRepr):
+        return message.channel.id, message.id, None
+    
+    if (message_type is MessageReference) or isinstance(message, MessageReference):
+        return message.channel_id, message.message_id, None
+    
+    raise TypeError(f'`message` can be given as  `{Message.__name__}`, `{MessageRepr.__name__}` or as '
+        f'`{MessageReference.__name__}` instance, got {message!r}.')
+
+
+def _get_guild_id(guild):
+    """
+    Returns the given guild's identifier.
+    
+    Parameters
+    ----------
+    guild : ``Guild`` or `int` instance
+        The guild or it's identifier.
+    
+    Returns
+    -------
+    guild_id : `int`
+        The guild's identifier.
+    
+    Raises
+    ------
+    TypeError
+        If `guild` was not given neither as ``Guild`` nor `int` instance.
+    """
+    if (type(guild) is Guild) or isinstance(guild, Guild):
+        return guild.id
+    
+    guild_id = maybe_snowflake(guild)
+    if guild_id is None:
+        raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
+            f'{guild.__class__.__name__}.')
+    
+    return guild_id
+
+
+def _assert_limit_1_100(limit):
+    """
+    Checks whether the given `limit` is an `int` in range [1:100]. Should be called only inside of `__debug__`
+    blocks.
+    
+    Parameters
+    ----------
+    limit : `Any`
+        The limit to check.
+    
+    Raises
+    ------
+    AssertionError
+        - If `limit` was not given as `int` instance.
+        - If `limit` is out of range [1:100].
+    """
+    if not isinstance(limit, int):
+        raise AssertionError(f'`limit` can be given as `int` instance, got {limit.__class__.__name__}.')
+    
+    if limit < 1 or limit > 100:
+        raise AssertionError(f'`limit` is out from the expected [1:100] range, got {limit!r}.')
+
+
+def _normalize_message_content_and_embed(content, embed):
+    """
+    Normalizes the given `content` and `embed` parameters of ``Client.message_create``.
+    
+    Parameters
+    ----------
+    content : `None`, `str`, ``EmbedBase``, `Any`
+        The message's content.
+    embed : `None`, ``EmbedBase`` instance or `list` of ``EmbedBase`` instances
+        The message's embedded content.
+    
+    Returns
+    -------
+    content : `None` or `str`
+        The message's content. Empty content is translated to `None`.
+    embed : `None` or ``EmbedBase`` instance
+        The message's embed.
+    
+    Raises
+    ------
+    TypeError
+        - If `embed` was given as `list`, but it contains not only ``EmbedBase`` instances.
+        - `content` parameter was given as ``EmbedBase`` instance, meanwhile `embed` parameter was given as well.
+    """
+    # Embed check order:
+    # 1.: None
+    # 2.: Embed
+    # 3.: list of Embed -> embed[0] or None
+    # 4.: raise
+    
+    if embed is None:
+        pass
+    elif isinstance(embed, EmbedBase):
+        pass
+    elif isinstance(embed, (list, tuple)):
+        if embed:
+            if __debug__:
+                for index, element in enumerate(embed):
+                    if isinstance(element, EmbedBase):
+                        continue
+                    
+                    raise TypeError(f'`embed` was given as a `list`, but it\'s element under index `{index}` '
+                        f'is not `{EmbedBase.__name__}` instance, but {element.__class__.__name__}`, got: '
+                        f'{embed.__class__.__name__}.')
+            
+            embed = embed[0]
+        else:
+            embed = None
+    else:
+        raise TypeError(f'`embed` was not given as `{EmbedBase.__name__}` instance, neither as a list of '
+            f'{EmbedBase.__name__} instances, got {embed.__class__.__name__}.')
+    
+    # Content check order:
+    # 1.: None
+    # 2.: str
+    # 3.: Embed - > embed = content
+    # 4.: list of Embed -> Embed = content[0]
+    # 5.: object -> str(content)
+    
+    if content is None:
+        pass
+    elif isinstance(content, str):
+        if not content:
+            content = None
+    elif isinstance(content, EmbedBase):
+        if __debug__:
+            if (embed is not None):
+                raise TypeError(f'Multiple embeds were given, got content={content!r}, embed={embed!r}.')
+        
+        embed = content
+        content = None
+    else:
+        # Check for list of embeds as well.
+        if isinstance(content, (list, tuple)):
+            if content:
+                for element in content:
+                    if isinstance(element, EmbedBase):
+                        continue
+                    
+                    is_list_of_embeds = False
+                    break
+                else:
+                    is_list_of_embeds = True
+            else:
+                is_list_of_embeds = False
+        else:
+            is_list_of_embeds = False
+        
+        if is_list_of_embeds:
+            if __debug__:
+                if (embed is not None):
+                    raise TypeError(f'Multiple embeds were given, got content={content!r}, embed={embed!r}.')
+            
+            embed = content[0]
+            content = None
+        else:
+            content = str(content)
+            if not content:
+                content = None
+    
+    return content, embed
+
+
+def _guess_file_name(io):
+    """
+    Guesses the name of the given file. If the file has no name, generates a random one.
+    
+    Parameters
+    ----------
+    io : `Any`
+        The file to guess it's name of.
+    
+    Returns
+    -------
+    name : `str`
+    """
+    return basename(getattr(io, 'name', '')) or token_hex(8)
+
+
+def _file_form_add_items(file, names, ios):
+    """
+    Adds the given dict like `file`'s items to the `names` and `ios` lists. Used by ``Client._create_file_form``.
+    
+    Parameters
+    ----------
+    file : `dict` like of (`str`, `io`) items
+        The files to send.
+    names : `list` of `str`
+        The names of the files to send.
+    ios : `list` of `io`
+        The files to send.
+    """
+    for name, io in file.items():
+        names.append(name)
+        ios.append(io)
+
+
+def _file_form_add_pair(file, names, ios):
+    """
+    Adds the given `name` - `io` pair to the `names` and `ios` lists. Used by ``Client._create_file_form``.
+    
+    Parameters
+    ----------
+    file : `tuple` (`str`, `io`)
+        The file to send.
+    names : `list` of `str`
+        The names of the files to send.
+    ios : `list` of `io`
+        The files to send.
+    """
+    name, io = file
+    names.append(name)
+    ios.append(io)
+
+
+def _file_form_add_multiple(file, names, ios):
+    """
+    Adds the given `io`-s and `name` - `io` pairs to the `names` and `ios` lists. Used by ``Client._create_file_form``.
+    
+    Parameters
+    ----------
+    file : `list` or `deque` of (`io`, `tuple` (`str`, `io`))
+        The files to send.
+    names : `list` of `str`
+        The names of the files to send.
+    ios : `list` of `io`
+        The files to send.
+    """
+    for element in file:
+        if type(element) is tuple:
+            name, io = element
+        else:
+            io = element
+            name = ''
+        
+        if not name:
+            name = _guess_file_name(io)
+        
+        names.append(name)
+        ios.append(io)
+
+
+def _file_form_add_any(file, names, ios):
+    """
+    Adds the given file or files to the `names` and `ios` lists. Called by ``Client._create_file_form`` if `file`'s
+    type is not in ``FILE_FORM_STRUCTURE_HANDLERS``, like at the case of subclasses.
+    
+    Parameters
+    ----------
+    file : `Any`
+        The file or files to send.
+    names : `list` of `str`
+        The names of the files to send.
+    ios : `list` of `io`
+        The files to send.
+    """
+    file_type = file.__class__
+    
+    # case 1 dict like
+    if hasattr(file_type, 'items'):
+        _file_form_add_items(file, names, ios)
+    
+    # case 2 tuple => file, filename pair
+    elif issubclass(file_type, tuple):
+        _file_form_add_pair(file, names, ios)
+    
+    # case 3 list like
+    elif issubclass(file_type, (list, deque)):
+        _file_form_add_multiple(file, names, ios)
+    
+    #case 4 file itself
+    else:
+        names.append(_guess_file_name(file))
+        ios.append(file)
+
+
+# Structure handlers of `Client._create_file_form` for the most common exact types.
+FILE_FORM_STRUCTURE_HANDLERS = {
+    dict  : _file_form_add_items,
+    tuple : _file_form_add_pair,
+    list  : _file_form_add_multiple,
+    deque : _file_form_add_multiple,
+        }
+
+# Field names of the files, when multiple files are sent by `Client._create_file_form`.
+FILE_FORM_FIELD_NAMES = tuple(f'file{index}s' for index in range(10))
+
+
+def _channel_move_check_parameters(channel, visual_position, category, lock_permissions):
+    """
+    Validates the parameters of a channel move.
+    
+    Parameters
+    ----------
+    channel : ``ChannelGuildBase`` instance
+        The channel to be moved.
+    visual_position : `int`
+        The visual position where the channel should go.
+    category : `None`, `Ellipsis`, ``ChannelCategory`` or ``Guild``
+        The channel's new parent.
+    lock_permissions : `bool`
+        Whether the channel's permissions should be synced with the new category.
+    
+    Returns
+    -------
+    guild : `None` or ``Guild``
+        The channel's guild. Returns `None` if the channel is partial.
+    category : ``ChannelCategory`` or ``Guild``
+        The channel's new parent.
+    visual_position : `int`
+        The visual position capped at `0`.
+    
+    Raises
+    ------
+    ValueError
+        - If the `channel` would be between guilds.
+        - If category channel would be moved under an other category.
+    TypeError
+        - If `ChannelGuildBase` was not passed as ``ChannelGuildBase`` instance.
+        - If `category` was not passed as `None`, or as ``Guild`` or ``ChannelCategory`` instance.
+    AssertionError
+        - If `visual_position` was not passed as `int` instance.
+        - If `lock_permissions` was not passed as `bool` instance.
+    """
+    # Check channel type
+    if not isinstance(channel, ChannelGuildBase):
+        raise TypeError(f'`channel` can be given as `{ChannelGuildBase.__name__}` instance, got '
+            f'{channel.__class__.__name__}.')
+    
+    # Check whether the channel is partial.
+    guild = channel.guild
+    if guild is None:
+        # Cannot move partial channels, leave
+        return None, None, 0
+    
+    # Check category
+    if category is ...:
+        category = channel.category
+    elif category is None:
+        category = guild
+    elif isinstance(category, Guild):
+        if guild is not category:
+            raise ValueError(f'Can not move channel between guilds! Channel\'s guild: {guild!r}; Category: '
+                f'{category!r}')
+    elif isinstance(category, ChannelCategory):
+        if category.guild is not guild:
+            raise ValueError(f'Can not move channel between guilds! Channel\'s guild: {guild!r}; Category\'s '
+                f'guild: {category.guild!r}')
+    else:
+        raise TypeError(f'Invalid type {channel.__class__.__name__}')
+    
+    # Cannot put category under category
+    if isinstance(channel, ChannelCategory) and isinstance(category, ChannelCategory):
+        raise ValueError(f'Can not move categroy chanen lunedr category channel. Channel: {channel!r}; Category: '
+                f'{category!r}')
+    
+    if __debug__:
+        if not isinstance(visual_position, int):
+            raise AssertionError(f'`visual_position` can be given as `int` instance, got '
+                f'{visual_position.__class__.__name__}.')
+        
+        if not isinstance(lock_permissions, bool):
+            raise AssertionError(f'`lock_permissions` can be given as `bool` instance, got '
+                f'{lock_permissions.__class__.__name__}.')
+    
+    # Cap at 0
+    if visual_position < 0:
+        visual_position = 0
+    
+    return guild, category, visual_position
+
+
+def _channel_move_create_display_state(guild):
+    """
+    Creates a display state of the guild's channels, where each channel is represented by a channel key.
+    
+    Parameters
+    ----------
+    guild : ``Guild``
+        The guild to create the display state of.
+    
+    Returns
+    -------
+    display_new : `list` of `tuple` (`int`, `int`, `int`, (`None` or `list` of `tuple`))
+        The channel keys of the guild. Each channel key contains the channel's order group, position, identifier and
+        the channel keys of it's sub channels.
+    """
+    # Create a display state, where each channel is listed. Categories' channel keys contain their sub channels'
+    # channel keys as their last element.
+    display_new = []
+    for iter_channel in guild.channel_list:
+        if isinstance(iter_channel, ChannelCategory):
+            display_sub_channels = []
+            for sub_channel in iter_channel.channel_list:
+                channel_key = (sub_channel.ORDER_GROUP, sub_channel.position, sub_channel.id, None)
+                display_sub_channels.append(channel_key)
+        else:
+            display_sub_channels = None
+        
+        channel_key = (iter_channel.ORDER_GROUP, iter_channel.position, iter_channel.id, display_sub_channels)
+        
+        display_new.append(channel_key)
+    
+    return display_new
+
+
+def _plan_channel_move(display_new, channel, visual_position, category):
+    """
+    Moves the channel's key inside of the given display state.
+    
+    Parameters
+    ----------
+    display_new : `list` of `tuple` (`int`, `int`, `int`, (`None` or `list` of `tuple`))
+        Display state created by ``_channel_move_create_display_state``. Modified in place.
+    channel : ``ChannelGuildBase`` instance
+        The channel to be moved.
+    visual_position : `int`
+        The visual position where the channel should go.
+    category : ``ChannelCategory`` or ``Guild``
+        The channel's new parent.
+    
+    Returns
+    -------
+    moved : `bool`
+        Whether the channel was found in the display state and it was moved.
+    """
+    # We get from where we will move from. The channel might have been moved already inside of the display state, so
+    # we look it up at every place.
+    to_check = [display_new]
+    for channel_key in display_new:
+        display_sub_channels = channel_key[3]
+        if display_sub_channels is not None:
+            to_check.append(display_sub_channels)
+    
+    channel_id = channel.id
+    
+    for move_from in to_check:
+        for index in range(len(move_from)):
+            channel_key = move_from[index]
+            
+            if channel_key[2] == channel_id:
+                channel_key_to_move = channel_key
+                del move_from[index]
+                break
+        else:
+            continue
+        
+        break
+    
+    else:
+        # If breaking was not done, our channel not exists, lol
+        return False
+    
+    # We get to where we will move to.
+    if isinstance(category, Guild):
+        move_to = display_new
+    else:
+        new_category_id = category.id
+        for channel_key in display_new:
+            if channel_key[2] == new_category_id:
+                move_to = channel_key[3]
+                break
+        
+        else:
+            # If no breaking was not done, our channel not exists, lol. Put the channel back, so the display state
+            # stays intact.
+            move_from.insert(index, channel_key_to_move)
+            return False
+    
+    # Move, yayyy
+    move_to.insert(visual_position, channel_key_to_move)
+    # Reorder
+    move_to.sort(key=CHANNEL_KEY_ORDER_GROUP_GETTER)
+    return True
+
+
+def _channel_move_create_data(guild, display_new, moved):
+    """
+    Creates the channel move request's data from the given display state.
+    
+    Parameters
+    ----------
+    guild : ``Guild``
+        The respective guild.
+    display_new : `list` of `tuple` (`int`, `int`, `int`, (`None` or `list` of `tuple`))
+        Display state created by ``_channel_move_create_display_state`` and modified by ``_plan_channel_move``.
+    moved : `dict` of (`int`, `dict` of (`str`, `Any`) items) items
+        The moved channels' identifiers and their prebuilt data entries. The entries' `'position'` is filled up by
+        this function.
+    
+    Returns
+    -------
+    data : `list` of `dict` of (`str`, `Any`) items
+    """
+    # Now we resort every channel in the guild and categories, mostly for security issues
+    to_sort_all = [display_new]
+    for channel_key in display_new:
+        display_sub_channels = channel_key[3]
+        if display_sub_channels is not None:
+            to_sort_all.append(display_sub_channels)
+    
+    # Calculate the new positions and put the changed ones directly into the data, so no intermediate
+    # `(position, channel_id)` pairs are allocated.
+    data = []
+    channels = guild.channels
+    
+    for to_sort in to_sort_all:
+        expected_channel_order_group = 0
+        channel_position = 0
+        for sort_key in to_sort:
+            channel_order_group = sort_key[0]
+            channel_id = sort_key[2]
+            
+            if channel_order_group != expected_channel_order_group:
+                expected_channel_order_group = channel_order_group
+                channel_position = 0
+            
+            try:
+                moved_entry = moved[channel_id]
+            except KeyError:
+                if channels[channel_id].position != channel_position:
+                    data.append({'id': channel_id, 'position': channel_position})
+            else:
+                moved_entry['position'] = channel_position
+                data.append(moved_entry)
+            
+            channel_position += 1
+            continue
+    
+    return data
+
 
 class Client(UserBase):
     """
@@ -167,6 +941,12 @@ class Client(UserBase):
     _gateway_waiter : `None` or ``Future``
         When client gateway is being requested multiple times at the same time, this future is set and awaited at the
         secondary requests.
+    _coalesced_requests : `dict` of (`tuple`, ``Task``) items
+        The running requests of the client, which are shared between the concurrent calls of the same request. Used
+        by ``.channel_pins`` and by ``.message_at_index``.
+    _message_coalescers : `dict` of (`int`, ``MessageCoalescer``) items
+        The active message coalescers of the client used by ``.message_create`` with `coalesce=True`. The keys are
+        the channels' ids.
     _status : ``Status``
         The client's preferred status.
     _user_chunker_nonce : `int`
@@ -196,8 +976,10 @@ class Client(UserBase):
         'guild_profiles', 'is_bot', 'partial', # default user
         'activities', 'status', 'statuses', # presence
         'email', 'flags', 'locale', 'mfa', 'premium_type', 'system', 'verified', # OAUTH 2
-        '__dict__', '_additional_owner_ids', '_activity', '_gateway_requesting', '_gateway_time', '_gateway_url',
-        '_gateway_max_concurrency', '_gateway_waiter', '_status', '_user_chunker_nonce', 'application', 'events',
+        '__dict__', '_additional_owner_ids', '_activity', '_coalesced_requests', '_gateway_requesting',
+        '_gateway_time', '_gateway_url', '_gateway_max_concurrency', '_gateway_waiter', '_message_coalescers',
+        '_status', '_user_chunker_nonce',
+        'application', 'events',
         'gateway', 'http', 'intents', 'private_channels', 'ready_state', 'group_channels', 'relationships', 'running',
         'secret', 'shard_count', 'token', 'voice_clients', )
     
@@ -428,6 +1210,8 @@ class Client(UserBase):
         self._gateway_max_concurrency = 1
         self._gateway_requesting = False
         self._gateway_waiter = None
+        self._message_coalescers = {}
+        self._coalesced_requests = {}
         self._user_chunker_nonce= 0
         self.group_channels = {}
         self.private_channels = {}
@@ -1413,13 +2197,7 @@ class Client(UserBase):
                 f'user={user!r}, access={access!r}.')
         
         
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         
         data = {'access_token': access_token}
@@ -2411,184 +3189,119 @@ class Client(UserBase):
         TypeError
             - If `ChannelGuildBase` was not passed as ``ChannelGuildBase`` instance.
             - If `category` was not passed as `None`, or as ``Guild`` or ``ChannelCategory`` instance.
-            
         ConnectionError
             No internet connection.
         DiscordException
             If any exception was received from the Discord API.
+        AssertionError
+            - If `visual_position` was not passed as `int` instance.
+            - If `lock_permissions` was not passed as `bool` instance.
         
         Notes
         -----
         This method also fixes the messy channel positions of Discord to an intuitive one.
         """
-        # Check channel type
-        if not isinstance(channel, ChannelGuildBase):
-            raise TypeError(f'`channel` can be given as `{ChannelGuildBase.__name__}` instance, got '
-                f'{channel.__class__.__name__}.')
-        
-        # Check whether the channel is partial.
-        guild = channel.guild
+        guild, category, visual_position = _channel_move_check_parameters(channel, visual_position, category,
+            lock_permissions)
         if guild is None:
-            # Cannot move partial channels, leave
             return
         
-        # Check category
-        if category is ...:
-            category = channel.category
-        elif category is None:
-            category = guild
-        elif isinstance(category, Guild):
-            if guild is not category:
-                raise ValueError(f'Can not move channel between guilds! Channel\'s guild: {guild!r}; Category: '
-                    f'{category!r}')
-        elif isinstance(category, ChannelCategory):
-            if category.guild is not guild:
-                raise ValueError(f'Can not move channel between guilds! Channel\'s guild: {guild!r}; Category\'s '
-                    f'guild: {category.guild!r}')
-        else:
-            raise TypeError(f'Invalid type {channel.__class__.__name__}')
-        
-        # Cannot put category under category
-        if isinstance(channel, ChannelCategory) and isinstance(category, ChannelCategory):
-            raise ValueError(f'Can not move categroy chanen lunedr category channel. Channel: {channel!r}; Category: '
-                    f'{category!r}')
-        
-        if not isinstance(visual_position, int):
-            raise TypeError(f'`visual_position` can be given as `int` instance, got '
-                f'{visual_position.__class__.__name__}.')
-        
-        if not isinstance(lock_permissions, bool):
-            raise TypeError(f'`lock_permissions` can be given as `bool` instance, got '
-                f'{lock_permissions.__class__.__name__}.')
-        
-        # Cap at 0
-        if visual_position < 0:
-            visual_position = 0
-        
         # If the channel is where it should be, we can leave.
         if channel.category is category and category.channel_list.index(channel) == visual_position:
             return
         
-        # Create a display state, where each channel is listed.
-        # Categories are inside of a tuple, where they are the first element of it and their channels are the second.
-        display_state = guild.channel_list
-        
-        for index in range(len(display_state)):
-            iter_channel = display_state[index]
-            if isinstance(iter_channel, ChannelCategory):
-                display_state[index] = iter_channel, iter_channel.channel_list
-        
-        # Generate a state where the channels are theoretically ordered with tuples
-        display_new = []
-        for iter_channel in display_state:
-            if isinstance(iter_channel, tuple):
-                iter_channel, sub_channels = iter_channel
-                display_sub_channels = []
-                for sub_channel in sub_channels:
-                    channel_key = (sub_channel.ORDER_GROUP, sub_channel.position, sub_channel.id, None)
-                    display_sub_channels.append(channel_key)
-            else:
-                display_sub_channels = None
-            
-            channel_key = (iter_channel.ORDER_GROUP, iter_channel.position, iter_channel.id, display_sub_channels)
-            
-            display_new.append(channel_key)
-        
-        # We have 2 display states, we will compare the old to the new one when calculating differences, but we didnt
-        # move our channel yet!
-        
-        # We get from where we will move from.
-        old_category = channel.category
-        if isinstance(old_category, Guild):
-            move_from = display_new
-        else:
-            old_category_id = old_category.id
-            for channel_key in display_new:
-                if channel_key[2] == old_category_id:
-                    move_from = channel_key[3]
-                    break
-            
-            else:
-                # If no breaking was not done, our channel not exists, lol
-                return
-        
-        # We got from which thing we will move from, so we remove first
+        display_new = _channel_move_create_display_state(guild)
+        if not _plan_channel_move(display_new, channel, visual_position, category):
+            return
         
         channel_id = channel.id
+        moved_entry = {
+            'id': channel_id,
+            'position': 0,
+            'lock_permissions': lock_permissions,
+            'parent_id': (None if category is guild else category.id),
+                }
         
-        for index in range(len(move_from)):
-            channel_key = move_from[index]
-            
-            if channel_key[2] == channel_id:
-                channel_key_to_move = channel_key
-                del move_from[index]
-                break
+        data = _channel_move_create_data(guild, display_new, {channel_id: moved_entry})
+        await self.http.channel_move(guild.id, data, reason)
+    
+    async def channel_move_bulk(self, guild, moves, *, lock_permissions=False, reason=None):
+        """
+        Moves more guild channels with one request. The moves are applied in order, each on the state left by the
+        previous one. If the algorithm can not place a channel exactly on the given location, it will place it as
+        close, as it can. If there is nothing to move, then the request is skipped.
         
-        else:
-            # If breaking was not done, our channel not exists, lol
-            return
+        This method is a coroutine.
         
-        # We get to where we will move to.
-        if isinstance(category, Guild):
-            move_to = display_new
-        else:
-            new_category_id = category.id
-            for channel_key in display_new:
-                if channel_key[2] == new_category_id:
-                    move_to = channel_key[3]
-                    break
-            
-            else:
-                # If no breaking was not done, our channel not exists, lol
-                return
+        Parameters
+        ----------
+        guild : ``Guild``
+            The guild, where the channels are.
+        moves : `iterable` of `tuple` (``ChannelGuildBase``, `int`, (`None`, `Ellipsis`, ``ChannelCategory`` or \
+                ``Guild``))
+            `channel` - `visual_position` - `category` triplets describing each move. `category` follows the same
+            rules as at ``.channel_move``.
+        lock_permissions : `bool`, Optional
+            If you want to sync the permissions of the moved channels with their new category set it to `True`.
+            Defaults to `False`.
+        reason : `None` or `str`, Optional
+            Shows up at the respective guild's audit logs.
         
-        # Move, yayyy
-        move_to.insert(visual_position, channel_key_to_move)
-        # Reorder
-        move_to.sort(key=lambda channel_key_: channel_key_[0])
+        Raises
+        ------
+        ValueError
+            - If any of the channels would be between guilds.
+            - If category channel would be moved under an other category.
+        TypeError
+            - If `guild` was not passed as ``Guild`` instance.
+            - If any `channel` was not passed as ``ChannelGuildBase`` instance.
+            - If any `category` was not passed as `None`, or as ``Guild`` or ``ChannelCategory`` instance.
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        AssertionError
+            - If `visual_position` was not passed as `int` instance.
+            - If `lock_permissions` was not passed as `bool` instance.
         
-        # Now we resort every channel in the guild and categories, mostly for security issues
-        to_sort_all = [display_new]
-        for channel_key in display_new:
-            display_sub_channels = channel_key[3]
-            if display_sub_channels is not None:
-                to_sort_all.append(display_sub_channels)
+        Notes
+        -----
+        This method also fixes the messy channel positions of Discord to an intuitive one.
+        """
+        if not isinstance(guild, Guild):
+            raise TypeError(f'`guild` can be given as `{Guild.__name__}` instance, got {guild.__class__.__name__}.')
         
-        ordered = []
+        display_new = None
+        moved = {}
         
-        for to_sort in to_sort_all:
-            expected_channel_order_group = 0
-            channel_position = 0
-            for sort_key in to_sort:
-                channel_order_group = sort_key[0]
-                channel_id = sort_key[2]
-                
-                if channel_order_group != expected_channel_order_group:
-                    expected_channel_order_group = channel_order_group
-                    channel_position = 0
-                
-                ordered.append((channel_position, channel_id))
-                channel_position += 1
+        for channel, visual_position, category in moves:
+            channel_guild, category, visual_position = _channel_move_check_parameters(channel, visual_position,
+                category, lock_permissions)
+            if channel_guild is None:
                 continue
-        
-        bonus_data = {'lock_permissions': lock_permissions}
-        if category is guild:
-            bonus_data['parent_id'] = None
-        else:
-            bonus_data['parent_id'] = category.id
-        
-        data = []
-        channels = guild.channels
-        for position, channel_id in ordered:
-            channel_ = channels[channel_id]
             
-            if channel is channel_:
-                data.append({'id': channel_id, 'position': position, **bonus_data})
+            if channel_guild is not guild:
+                raise ValueError(f'Can not move channel between guilds! Channel\'s guild: {channel_guild!r}; Guild: '
+                    f'{guild!r}')
+            
+            if display_new is None:
+                display_new = _channel_move_create_display_state(guild)
+            
+            if not _plan_channel_move(display_new, channel, visual_position, category):
                 continue
             
-            if channel_.position != position:
-                data.append({'id': channel_id, 'position': position})
+            channel_id = channel.id
+            moved[channel_id] = {
+                'id': channel_id,
+                'position': 0,
+                'lock_permissions': lock_permissions,
+                'parent_id': (None if category is guild else category.id),
+                    }
+        
+        if not moved:
+            return
         
+        data = _channel_move_create_data(guild, display_new, moved)
         await self.http.channel_move(guild.id, data, reason)
     
     async def channel_edit(self, channel, *, name=None, topic=None, nsfw=None, slowmode=None, user_limit=None,
@@ -2651,6 +3364,9 @@ class Client(UserBase):
         """
         if isinstance(channel, ChannelGuildBase):
             channel_id = channel.id
+            # Look up the channel's type only once. Exact types are matched by identity, before falling back to
+            # `issubclass` for subclasses.
+            channel_type = channel.__class__
         else:
             channel_id = maybe_snowflake(channel)
             if channel_id is None:
@@ -2658,6 +3374,7 @@ class Client(UserBase):
                     f'got {channel.__class__.__name__}.')
             
             channel = None
+            channel_type = None
         
         data = {}
         
@@ -2676,10 +3393,10 @@ class Client(UserBase):
         
         if (topic is not None):
             if __debug__:
-                if (channel is not None):
-                    if not isinstance(channel, ChannelText):
-                        raise AssertionError(f'`topic` is a valid parameter only for {ChannelText.__name__} '
-                            f'instances, got {channel.__class__.__name__}.')
+                if (channel_type is not None) and (channel_type is not ChannelText) and \
+                        (not issubclass(channel_type, ChannelText)):
+                    raise AssertionError(f'`topic` is a valid parameter only for {ChannelText.__name__} '
+                        f'instances, got {channel_type.__name__}.')
                 
                 if not isinstance(topic, str):
                     raise AssertionError(f'`topic` can be given as `str` instance, got {topic.__class__.__name__}.')
@@ -2694,10 +3411,10 @@ class Client(UserBase):
         
         if (type_ is not None):
             if __debug__:
-                if (channel is not None):
-                    if not isinstance(channel, ChannelText):
-                        raise AssertionError(f'`type_` is a valid parameter only for `{ChannelText.__name__}` '
-                            f'instances, but got {channel.__class__.__name__}.')
+                if (channel_type is not None) and (channel_type is not ChannelText) and \
+                        (not issubclass(channel_type, ChannelText)):
+                    raise AssertionError(f'`type_` is a valid parameter only for `{ChannelText.__name__}` '
+                        f'instances, but got {channel_type.__name__}.')
                 
                 if not isinstance(type_, int):
                     raise AssertionError(f'`type_` can be given as `int` instance, got {type_.__class__.__name__}.')
@@ -2710,10 +3427,10 @@ class Client(UserBase):
         
         if (nsfw is not None):
             if __debug__:
-                if (channel is not None):
-                    if not isinstance(channel, (ChannelText, ChannelStore)):
-                        raise AssertionError(f'`nsfw` is a valid parameter only for `{ChannelText.__name__}` and '
-                            f'`{ChannelStore.__name__}` instances, but got {channel.__class__.__name__}.')
+                if (channel_type is not None) and (channel_type not in (ChannelText, ChannelStore)) and \
+                        (not issubclass(channel_type, (ChannelText, ChannelStore))):
+                    raise AssertionError(f'`nsfw` is a valid parameter only for `{ChannelText.__name__}` and '
+                        f'`{ChannelStore.__name__}` instances, but got {channel_type.__name__}.')
                 
                 if not isinstance(nsfw, bool):
                     raise AssertionError(f'`nsfw` can be given as `bool` instance, got {nsfw.__class__.__name__}.')
@@ -2723,10 +3440,10 @@ class Client(UserBase):
         
         if (slowmode is not None):
             if __debug__:
-                if (channel is not None):
-                    if not isinstance(channel, ChannelText):
-                        raise AssertionError(f'`slowmode` is a valid parameter only for `{ChannelText.__name__}` '
-                            f'instances, but got {channel.__class__.__name__}.')
+                if (channel_type is not None) and (channel_type is not ChannelText) and \
+                        (not issubclass(channel_type, ChannelText)):
+                    raise AssertionError(f'`slowmode` is a valid parameter only for `{ChannelText.__name__}` '
+                        f'instances, but got {channel_type.__name__}.')
                     
                 if not isinstance(slowmode, int):
                     raise AssertionError('`slowmode` can be given as `int` instance, got '
@@ -2740,10 +3457,10 @@ class Client(UserBase):
         
         if (bitrate is not None):
             if __debug__:
-                if (channel is not None):
-                    if not isinstance(channel, ChannelVoice):
-                        raise AssertionError(f'`bitrate` is a valid parameter only for `{ChannelVoice.__name__}` '
-                            f'instances, but got {channel.__class__.__name__}.')
+                if (channel_type is not None) and (channel_type is not ChannelVoice) and \
+                        (not issubclass(channel_type, ChannelVoice)):
+                    raise AssertionError(f'`bitrate` is a valid parameter only for `{ChannelVoice.__name__}` '
+                        f'instances, but got {channel_type.__name__}.')
                     
                 if not isinstance(bitrate, int):
                     raise AssertionError('`bitrate` can be given as `int` instance, got '
@@ -2768,10 +3485,10 @@ class Client(UserBase):
         
         if (user_limit is not None):
             if __debug__:
-                if (channel is not None):
-                    if not isinstance(channel, ChannelVoice):
-                        raise AssertionError(f'`user_limit` is a valid parameter only for `{ChannelVoice.__name__}` '
-                            f'instances, but got {channel.__class__.__name__}.')
+                if (channel_type is not None) and (channel_type is not ChannelVoice) and \
+                        (not issubclass(channel_type, ChannelVoice)):
+                    raise AssertionError(f'`user_limit` is a valid parameter only for `{ChannelVoice.__name__}` '
+                        f'instances, but got {channel_type.__name__}.')
                 
                 if user_limit < 0 or user_limit > 99:
                     raise AssertionError('`user_limit`\'s value is out of the expected [0:99] range, got '
@@ -2956,7 +3673,7 @@ class Client(UserBase):
                 raise TypeError(f'`source_channel` can be given as {ChannelText.__name__} or `int` instance, got '
                     f'{source_channel.__class__.__name__}.')
             
-            source_channel = ChannelText.precreate(source_channel_id)
+            source_channel = None
         
         if isinstance(target_channel, ChannelText):
             target_channel_id = target_channel.id
@@ -2966,13 +3683,21 @@ class Client(UserBase):
                 raise TypeError(f'`channel` can be given as {ChannelText.__name__} or `int` instance, got '
                     f'{target_channel.__class__.__name__}.')
             
-            target_channel = ChannelText.precreate(target_channel_id)
+            target_channel = None
         
         data = {
             'webhook_channel_id': target_channel_id,
                 }
         
         data = await self.http.channel_follow(source_channel_id, data)
+        
+        # Precreate the channels only after the request succeeded. `precreate` returns the cached channel if there is.
+        if source_channel is None:
+            source_channel = ChannelText.precreate(source_channel_id)
+        
+        if target_channel is None:
+            target_channel = ChannelText.precreate(target_channel_id)
+        
         webhook = await Webhook._from_follow_data(data, source_channel, target_channel, self)
         return webhook
     
@@ -3013,6 +3738,57 @@ class Client(UserBase):
         channel = ChannelText.precreate(channel_id)
         return channel
     
+    def _coalesce_request(self, key, function, *args):
+        """
+        Starts the given request, or if a request with the same key is already running, joins to it. Used by
+        read-only requests, which yield the same result for concurrent calls.
+        
+        Parameters
+        ----------
+        key : `tuple`
+            Identifies the request.
+        function : `async-callable`
+            The coroutine function to start the request with.
+        *args : Arguments
+            Arguments to call the coroutine function with.
+        
+        Returns
+        -------
+        waiter : ``Future``
+            Shielded waiter, so cancelling a caller will not cancel the shared request.
+        """
+        requests = self._coalesced_requests
+        task = requests.get(key, None)
+        if task is None:
+            task = Task(self._run_coalesced_request(key, function, args), KOKORO)
+            requests[key] = task
+        
+        return shield(task, KOKORO)
+    
+    async def _run_coalesced_request(self, key, function, args):
+        """
+        Runs a request started by ``._coalesce_request`` and removes it from the running ones when it finishes.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        key : `tuple`
+            Identifies the request.
+        function : `async-callable`
+            The coroutine function to start the request with.
+        args : `tuple` of `Any`
+            Arguments to call the coroutine function with.
+        
+        Returns
+        -------
+        result : `Any`
+        """
+        try:
+            return await function(*args)
+        finally:
+            del self._coalesced_requests[key]
+    
     async def message_logs(self, channel, limit=100, *, after=None, around=None, before=None):
         """
         Requests messages from the given text channel. The `after`, `around` and the `before` arguments are mutually
@@ -3063,23 +3839,10 @@ class Client(UserBase):
             channel.
         - ``.message_iterator`` : An iterator over a channel's message history.
         """
-        if isinstance(channel, ChannelTextBase):
-            channel_id = channel.id
-        
-        else:
-            channel_id = maybe_snowflake(channel)
-            if channel_id is None:
-                raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` or `int` instance, got '
-                    f'{channel.__class__.__name__}.')
-            
-            channel = CHANNELS.get(channel_id)
+        channel, channel_id = _resolve_text_channel(channel)
         
         if __debug__:
-            if not isinstance(limit, int):
-                raise AssertionError(f'`limit` can be given as `int` instance, got {limit.__class__.__name__}.')
-            
-            if limit < 1 or limit > 100:
-                raise AssertionError(f'`limit` is out from the expected [1:100] range, got {limit!r}.')
+            _assert_limit_1_100(limit)
         
         data = {'limit': limit}
         
@@ -3132,23 +3895,10 @@ class Client(UserBase):
             - If `limit` was not given as `int` instance.
             - If `limit` is out of range [1:100].
         """
-        if isinstance(channel, ChannelTextBase):
-            channel_id = channel.id
-        
-        else:
-            channel_id = maybe_snowflake(channel)
-            if channel_id is None:
-                raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` or `int` instance, got '
-                    f'{channel.__class__.__name__}.')
-            
-            channel = CHANNELS.get(channel_id)
+        channel, channel_id = _resolve_text_channel(channel)
         
         if __debug__:
-            if not isinstance(limit, int):
-                raise AssertionError(f'`limit` can be given as `int` instance, got {limit.__class__.__name__}.')
-            
-            if limit < 1 or limit > 100:
-                raise AssertionError(f'`limit` is out from the expected [1:100] range, got {limit!r}.')
+            _assert_limit_1_100(limit)
         
         data = {'limit': limit, 'before': 9223372036854775807}
         data = await self.http.message_logs(channel_id, data)
@@ -3189,16 +3939,7 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(channel, ChannelTextBase):
-            channel_id = channel.id
-        
-        else:
-            channel_id = maybe_snowflake(channel)
-            if channel_id is None:
-                raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` or `int` instance, got '
-                    f'{channel.__class__.__name__}.')
-            
-            channel = CHANNELS.get(channel_id)
+        channel, channel_id = _resolve_text_channel(channel)
         
         data = await self.http.message_get(channel_id, message_id)
         
@@ -3208,7 +3949,7 @@ class Client(UserBase):
         return channel._create_unknown_message(data)
     
     async def message_create(self, channel, content=None, *, embed=None, file=None, allowed_mentions=..., tts=False,
-            nonce=None):
+            nonce=None, coalesce=False):
         """
         Creates and returns a message at the given `channel`. If there is nothing to send, then returns `None`.
         
@@ -3238,6 +3979,12 @@ class Client(UserBase):
             Whether the message is text-to-speech.
         nonce : `str`, Optional
             Used for optimisting message sending. Will shop up at the message's data.
+        coalesce : `bool`, Optional
+            Whether plain `str` content can be sent together with the contents of other coalesced messages, which are
+            sent to the same channel within `0.25` seconds, up to `2000` characters. Defaults to `False`.
+            
+            Only applied when sending just content, without replying on any message. The coalesced calls return the
+            same message.
         
         Returns
         -------
@@ -3265,126 +4012,47 @@ class Client(UserBase):
         ``.webhook_message_create`` : Sending a message with a ``Webhook``.
         """
         
-        # Channel check order:
-        # 1.: ChannChannelTextBaseelText -> channel
-        # 2.: Message -> channel + reply
-        # 3.: int (str) -> channel
-        # 4.: MessageRepr -> channel + reply
-        # 5.: MessageReference -> channel + reply
-        # 6.: raise
-        
-        if isinstance(channel, ChannelTextBase):
-            message_id = None
-            channel_id = channel.id
-        elif isinstance(channel, Message):
-            message_id = channel.id
-            channel = channel.channel
-            channel_id = channel.id
-        else:
+        # Channels and messages return their target directly, only ids are left to resolve.
+        try:
+            as_target = channel._as_target
+        except AttributeError:
             channel_id = maybe_snowflake(channel)
-            if (channel_id is not None):
-                message_id = None
-                channel = CHANNELS.get(channel_id)
-            elif isinstance(channel, MessageRepr):
-                message_id = channel.id
-                channel = channel.channel
-                channel_id = channel.id
-            elif isinstance(channel, MessageReference):
-                channel_id = channel.channel_id
-                message_id = channel.message_id
-                channel = CHANNELS.get(channel_id)
-            else:
+            if channel_id is None:
                 raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}`, `{Message.__name__}`, '
                     f'`{MessageRepr.__name__}` or as `{MessageReference.__name__}` instance, got '
                     f'{channel.__class__.__name__}.')
-        
-        # Embed check order:
-        # 1.: None
-        # 2.: Embed
-        # 3.: list of Embed -> embed[0] or None
-        # 4.: raise
-        
-        if embed is None:
-            pass
-        elif isinstance(embed, EmbedBase):
-            pass
-        elif isinstance(embed, (list, tuple)):
-            if embed:
-                if __debug__:
-                    for index, element in enumerate(embed):
-                        if isinstance(element, EmbedBase):
-                            continue
-                        
-                        raise TypeError(f'`embed` was given as a `list`, but it\'s element under index `{index}` '
-                            f'is not `{EmbedBase.__name__}` instance, but {embed_element.__class__.__name__}`, got: '
-                            f'{embed.__class__.__name__}.')
-                
-                embed = embed[0]
-            else:
-                embed = None
+            
+            message_id = None
+            channel = CHANNELS.get(channel_id)
         else:
-            raise TypeError(f'`embed` was not given as `{EmbedBase.__name__}` instance, neither as a list of '
-                f'{EmbedBase.__name__} instances, got {embed.__class__.__name__}.')
-        
-        # Content check order:
-        # 1.: None
-        # 2.: str
-        # 3.: Embed - > embed = content
-        # 4.: list of Embed -> Embed = content[0]
-        # 5.: object -> str(content)
+            channel, channel_id, message_id = as_target()
         
-        if content is None:
-            pass
-        elif isinstance(content, str):
+        # Most of the messages have only `str` content, so check for it first.
+        if (embed is None) and (type(content) is str):
             if not content:
                 content = None
-        elif isinstance(content, EmbedBase):
-            if __debug__:
-                if (embed is not None):
-                    raise TypeError(f'Multiple embeds were given, got content={content!r}, embed={embed!r}.')
-            
-            embed = content
-            content = None
         else:
-            # Check for list of embeds as well.
-            if isinstance(content, (list, tuple)):
-                if content:
-                    for element in content:
-                        if isinstance(element, EmbedBase):
-                            continue
-                        
-                        is_list_of_embeds = False
-                        break
-                    else:
-                        is_list_of_embeds = True
-                else:
-                    is_list_of_embeds = False
-            else:
-                is_list_of_embeds = False
-            
-            if is_list_of_embeds:
-                if __debug__:
-                    if (embed is not None):
-                        raise TypeError(f'Multiple embeds were given, got content={content!r}, embed={embed!r}.')
-                
-                embed = content[0]
-                content = None
-            else:
-                content = str(content)
-                if not content:
-                    content = None
-        
-        # Build payload
-        message_data = {}
-        contains_content = False
+            content, embed = _normalize_message_content_and_embed(content, embed)
         
-        if (content is not None):
-            message_data['content'] = content
-            contains_content = True
+        if coalesce and (content is not None) and (embed is None) and (file is None) and (not tts) and \
+                (nonce is None) and (allowed_mentions is ...) and (message_id is None):
+            data = await self._message_create_coalesced(channel_id, content)
+            if (channel is not None):
+                return channel._create_new_message(data)
+            
+            return None
         
-        if (embed is not None):
-            message_data['embed'] = embed.to_data()
-            contains_content = True
+        # Build payload, starting with the fields every message has at least one of.
+        if embed is None:
+            if content is None:
+                message_data = {}
+            else:
+                message_data = {'content': content}
+        else:
+            if content is None:
+                message_data = {'embed': embed.to_data()}
+            else:
+                message_data = {'content': content, 'embed': embed.to_data()}
         
         if tts:
             message_data['tts'] = True
@@ -3404,16 +4072,52 @@ class Client(UserBase):
             to_send = self._create_file_form(message_data, file)
             if to_send is None:
                 to_send = message_data
-            else:
-                contains_content = True
         
-        if not contains_content:
+        # A message needs content, embed or a file to be sent.
+        if (content is None) and (embed is None) and (to_send is message_data):
             return None
         
         data = await self.http.message_create(channel_id, to_send)
         if (channel is not None):
             return channel._create_new_message(data)
     
+    async def _message_create_coalesced(self, channel_id, content):
+        """
+        Adds the given content to the channel's active ``MessageCoalescer`` and waits till it is sent. If there is
+        no active coalescer at the channel, or if the content does not fit into it, starts a new one.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        channel_id : `int`
+            The channel's id where the message will be sent.
+        content : `str`
+            The message's content.
+        
+        Returns
+        -------
+        data : `dict` of (`str`, `Any`) items
+            The created message's data.
+        
+        Raises
+        ------
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        coalescer = self._message_coalescers.get(channel_id, None)
+        if (coalescer is None) or (not coalescer.add(content)):
+            if (coalescer is not None):
+                coalescer.flush()
+            
+            coalescer = MessageCoalescer(self, channel_id)
+            coalescer.add(content)
+        
+        # Every caller shares the same waiter, so shield it, else cancelling one caller would cancel the others too.
+        return await shield(coalescer.waiter, KOKORO)
+    
     @staticmethod
     def _create_file_form(data, file):
         """
@@ -3463,64 +4167,31 @@ class Client(UserBase):
         `0` (or later if needed) on close, instead of really closing instantly. These datatypes implement a
         `.real_close()` method, but they do `real_close` on `__exit__` as well.
         """
-        form = Formdata()
-        form.add_field('payload_json', to_json(data))
-        files = []
+        names = []
+        ios = []
         
         # checking structure
+        FILE_FORM_STRUCTURE_HANDLERS.get(file.__class__, _file_form_add_any)(file, names, ios)
         
-        # case 1 dict like
-        if hasattr(type(file), 'items'):
-            files.extend(file.items())
-        
-        # case 2 tuple => file, filename pair
-        elif isinstance(file, tuple):
-            files.append(file)
-        
-        # case 3 list like
-        elif isinstance(file, (list, deque)):
-            for element in file:
-                if type(element) is tuple:
-                    name, io = element
-                else:
-                    io = element
-                    name = ''
-                
-                if not name:
-                    #guessing name
-                    name = getattr(io, 'name', '')
-                    if name:
-                        _, name = splitpath(name)
-                    else:
-                        name = str(random_id())
-                
-                files.append((name, io),)
+        # checking the amount of files
+        # case 0, no files -> return None, we should use the already existing data
+        file_count = len(names)
+        if not file_count:
+            return None
         
-        #case 4 file itself
-        else:
-            name = getattr(file, 'name', '')
-            #guessing name
-            if name:
-                _, name = splitpath(name)
-            else:
-                name = str(random_id())
-            
-            files.append((name, file),)
+        form = Formdata()
+        form.add_json_field('payload_json', data, added_json_serializer)
         
-        # checking the amount of files
         # case 1 one file
-        if len(files) == 1:
-            name, io = files[0]
-            form.add_field('file', io, filename=name, content_type='application/octet-stream')
-        # case 2, no files -> return None, we should use the already existing data
-        elif len(files) == 0:
-            return None
-        # case 3 maximum 10 files
-        elif len(files) < 11:
-            for index, (name, io) in enumerate(files):
-                form.add_field(f'file{index}s', io, filename=name, content_type='application/octet-stream')
+        if file_count == 1:
+            form.add_field('file', ios[0], filename=names[0], content_type='application/octet-stream')
+        # case 2 maximum 10 files
+        elif file_count < 11:
+            for index in range(file_count):
+                form.add_field(FILE_FORM_FIELD_NAMES[index], ios[index], filename=names[index],
+                    content_type='application/octet-stream')
         
-        # case 4 more than 10 files
+        # case 3 more than 10 files
         else:
             raise ValueError('You can send maximum 10 files at once.')
         
@@ -3553,6 +4224,7 @@ class Client(UserBase):
         Returns
         -------
         allowed_mentions : `dict` of (`str`, `Any`) items
+            The returned dictionary might be shared, so it should not be modified.
         
         Raises
         ------
@@ -3562,55 +4234,50 @@ class Client(UserBase):
             If `allowed_mentions` contains en element of correct type, but an invalid value.
         """
         if (allowed_mentions is None):
-            return {'parse': []}
+            return ALLOWED_MENTIONS_NONE
         
         if isinstance(allowed_mentions, list):
             if (not allowed_mentions):
-                return {'parse': []}
+                return ALLOWED_MENTIONS_NONE
         else:
             allowed_mentions = [allowed_mentions]
         
-        allow_replied_user = 0
-        allow_everyone = 0
-        allow_users = 0
-        allow_roles = 0
+        # Most of the time only users or only roles are given, at that case we can skip checking each element one by
+        # one.
+        element_type = allowed_mentions[0].__class__
+        if (element_type is not str) and all(element.__class__ is element_type for element in allowed_mentions):
+            if issubclass(element_type, UserBase):
+                return {'users': [element.id for element in allowed_mentions]}
+            
+            if issubclass(element_type, Role):
+                return {'roles': [element.id for element in allowed_mentions]}
+        
+        # replied_user, everyone, users, roles
+        flags = [0, 0, 0, 0]
         
         allowed_users = None
         allowed_roles = None
         
         for element in allowed_mentions:
-            if isinstance(element, str):
-                if element == '!replied_user':
-                    allow_replied_user = -1
-                    continue
-                
-                if element == 'replied_user':
-                    allow_replied_user = 1
-                    continue
-                
-                if element == 'everyone':
-                    allow_everyone = 1
-                    continue
-                
-                if element == 'users':
-                    allow_users = 1
-                    continue
-                
-                if element == 'roles':
-                    allow_roles = 1
-                    continue
+            element_type = element.__class__
+            if (element_type is str) or issubclass(element_type, str):
+                try:
+                    flag_index, flag_value = ALLOWED_MENTIONS_STR_ELEMENTS[element]
+                except KeyError:
+                    raise ValueError(f'`allowed_mentions` contains a not valid `str` element: `{element!r}`. Type`str` '
+                        f'elements can be one of: (\'everyone\', \'users\', \'roles\').') from None
                 
-                raise ValueError(f'`allowed_mentions` contains a not valid `str` element: `{element!r}`. Type`str` '
-                    f'elements can be one of: (\'everyone\', \'users\', \'roles\').')
+                flags[flag_index] = flag_value
+                continue
             
-            if isinstance(element, UserBase):
+            if issubclass(element_type, UserBase):
                 if allowed_users is None:
                     allowed_users = []
                 
                 allowed_users.append(element.id)
                 continue
             
-            if isinstance(element, Role):
+            if issubclass(element_type, Role):
                 if allowed_roles is None:
                     allowed_roles = []
                 
@@ -3620,41 +4287,17 @@ class Client(UserBase):
             raise TypeError(f'`allowed_mentions` contains an element of an invalid type: `{element!r}`. The allowed '
                 f'types are: `str`, `Role` and any `UserBase` instances.')
         
-        
-        result = {}
-        parse_all_of = None
-        
-        if allow_replied_user:
-            result['replied_user'] = (allow_replied_user > 0)
-        
-        if allow_everyone:
-            if parse_all_of is None:
-                parse_all_of = []
-                result['parse'] = parse_all_of
-            
-            parse_all_of.append('everyone')
-        
-        if allow_users:
-            if parse_all_of is None:
-                parse_all_of = []
-                result['parse'] = parse_all_of
-            
-            parse_all_of.append('users')
-        else:
-            if (allowed_users is not None):
-                result['users'] = allowed_users
-        
-        if allow_roles:
-            if parse_all_of is None:
-                parse_all_of = []
-                result['parse'] = parse_all_of
+        if (allowed_users is None) and (allowed_roles is None):
+            # Only `str` elements were given, which can be combined only on a few ways, so cache them.
+            flags = tuple(flags)
+            try:
+                result = ALLOWED_MENTIONS_PRESETS[flags]
+            except KeyError:
+                result = ALLOWED_MENTIONS_PRESETS[flags] = _create_allowed_mentions(flags, None, None)
             
-            parse_all_of.append('roles')
-        else:
-            if (allowed_roles is not None):
-                result['roles'] = allowed_roles
+            return result
         
-        return result
+        return _create_allowed_mentions(flags, allowed_users, allowed_roles)
     
     async def message_delete(self, message, reason=None):
         """
@@ -3684,7 +4327,7 @@ class Client(UserBase):
         if message.deleted:
             return
         
-        if (message.author is self) or (message.id > int((time_now()-1209590.)*1000.-DISCORD_EPOCH)<<22):
+        if (message.author is self) or (message.id > (int(time_now()*1000.)-TWO_WEEKS_SAFE_SNOWFLAKE_OFFSET)<<22):
             # own or new
             coro = self.http.message_delete(message.channel.id, message.id, reason)
         else:
@@ -3727,153 +4370,208 @@ class Client(UserBase):
 
         if not isinstance(channel, ChannelGuildBase):
             # Bulk delete is available only at guilds. At private or group channel you can delete only yours tho.
-            for message in messages:
-                await self.http.message_delete(channel_id, message.id, reason)
+            # Delete them parallelly, limited to the ratelimit group's size.
+            async with ScarletExecutor(PRIVATE_MESSAGE_DELETE_PARALLELISM) as scarlet:
+                for message in messages:
+                    await scarlet.add(self.http.message_delete(channel_id, message.id, reason))
             
             return
         
-        message_group_new = deque()
-        message_group_old = deque()
-        message_group_old_own = deque()
+        # The groups are filled up in reversed order, so we can consume them from their end.
+        message_group_new = []
+        message_group_old = []
+        message_group_old_own = []
         
-        bulk_delete_limit = int((time_now()-1209600.)*1000.-DISCORD_EPOCH)<<22 # 2 weeks
+        bulk_delete_limit = (int(time_now()*1000.)-TWO_WEEKS_SNOWFLAKE_OFFSET)<<22 # 2 weeks
         
-        for message in messages:
+        # The classification depends on the current time and on the deleting client, so it cannot be cached on the
+        # messages, but we can look up everything, what does not change per message, only once.
+        add_new = message_group_new.append
+        add_old = message_group_old.append
+        add_old_own = message_group_old_own.append
+        
+        for message in reversed(messages):
             if message.deleted:
                 continue
             
             message_id = message.id
-            own = (message.author == self)
+            own = (message.author is self)
             
             if message_id > bulk_delete_limit:
-                message_group_new.append((own, message_id),)
+                add_new((own, message_id),)
+            elif own:
+                add_old_own(message_id)
+            else:
+                add_old(message_id)
+        
+        # Each endpoint is consumed by it's own worker. The mass worker might move messages into the old groups after
+        # their worker already finished, so we restart them till every group is empty.
+        while message_group_new or message_group_old or message_group_old_own:
+            # Start only the workers, which have anything to do.
+            coroutines = []
+            if message_group_new:
+                coroutines.append(self._message_delete_multiple_mass(channel_id, message_group_new, message_group_old,
+                    message_group_old_own))
+            
+            if message_group_new or message_group_old_own:
+                coroutines.append(self._message_delete_multiple_new(channel_id, message_group_new,
+                    message_group_old_own, reason))
+            
+            if message_group_old:
+                coroutines.append(self._message_delete_multiple_old(channel_id, message_group_old, reason))
+            
+            # A single worker can be awaited directly, without creating a task and a waiter for it.
+            if len(coroutines) == 1:
+                await coroutines[0]
                 continue
             
-            if own:
-                group = message_group_old_own
-            else:
-                group = message_group_old
+            tasks = [Task(coroutine, KOKORO) for coroutine in coroutines]
+            done, pending = await WaitTillExc(tasks, KOKORO)
+            for task in pending:
+                task.cancel()
             
-            group.append(message_id)
-            continue
+            for task in done:
+                task.result()
+    
+    async def _message_delete_multiple_mass(self, channel_id, message_group_new, message_group_old,
+            message_group_old_own):
+        """
+        Called by ``.message_delete_multiple`` parallelly with ``._message_delete_multiple_new`` and with
+        ``._message_delete_multiple_old``.
         
-        tasks = []
+        Bulk deletes the messages of `message_group_new` by 100. If a message got too old meanwhile, moves it to the
+        respective old group.
         
-        delete_mass_task = None
-        delete_new_task = None
-        delete_old_task = None
+        This method is a coroutine.
         
-        while True:
-            if delete_mass_task is None:
-                message_limit = len(message_group_new)
-                
-                # 0 is all good, but if it is more, lets check them
-                if message_limit:
-                    message_ids = []
-                    message_count = 0
-                    limit = int((time_now()-1209590.)*1000.-DISCORD_EPOCH)<<22 # 2 weeks - 10s
-                    
-                    while message_group_new:
-                        own, message_id = message_group_new.popleft()
-                        if message_id > limit:
-                            message_ids.append(message_id)
-                            message_count += 1
-                            if message_count == 100:
-                                break
-                            continue
-                        
-                        if (message_id+20971520000) < limit:
-                            continue
-                        
-                        # If the message is really older than the limit, with ingoring the 10 second, then we move it.
-                        if own:
-                            group = message_group_old_own
-                        else:
-                            group = message_group_old
-                        
-                        group.appendleft(message_id)
-                        continue
-                    
-                    if message_count:
-                        if message_count == 1:
-                            if (delete_new_task is None):
-                                message_id = message_ids[0]
-                                delete_new_task = Task(self.http.message_delete(channel_id, message_id, None), KOKORO)
-                                tasks.append(delete_new_task)
-                        else:
-                            delete_mass_task = Task(self.http.message_delete_multiple(channel_id,
-                                {'messages': message_ids}, None), KOKORO)
-                            tasks.append(delete_mass_task)
-            
-            if delete_old_task is None:
-                if message_group_old:
-                    message_id = message_group_old.popleft()
-                    delete_old_task = Task(self.http.message_delete_b2wo(channel_id, message_id, reason), KOKORO)
-                    tasks.append(delete_old_task)
-            
-            if delete_new_task is None:
-                if message_group_new:
-                    group = message_group_new
-                elif message_group_old_own:
-                    group = message_group_old_own
-                else:
-                    group = None
-                
-                if (group is not None):
-                    message_id = message_group_old_own.popleft()
-                    delete_new_task = Task(self.http.message_delete(channel_id, message_id, reason), KOKORO)
-                    tasks.append(delete_new_task)
+        Parameters
+        ----------
+        channel_id : `int`
+            The messages' channel's id.
+        message_group_new : `list` of `tuple` (`bool`, `int`)
+            `own` - `message_id` pairs of the messages, which are younger than 2 weeks.
+        message_group_old : `list` of `int`
+            The messages' identificators, which are older than 2 weeks and are not own.
+        message_group_old_own : `list` of `int`
+            The messages' identificators, which are older than 2 weeks and are own.
+        
+        Raises
+        ------
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        pop_new = message_group_new.pop
+        add_old = message_group_old.append
+        add_old_own = message_group_old_own.append
+        
+        while message_group_new:
+            message_ids = []
+            message_count = 0
+            # Calculated once for each batch, since between two batches we might wait for ratelimits.
+            limit = (int(time_now()*1000.)-TWO_WEEKS_SAFE_SNOWFLAKE_OFFSET)<<22 # 2 weeks - 10s
             
-            if not tasks:
-                # It can happen, that there are no more tasks left,  at that case we check if there is more message
-                # left. Only at `message_group_new` can be anymore message, because there is a time intervallum of 10
-                # seconds, what we do not move between categories.
-                if not message_group_new:
-                    break
+            while message_group_new:
+                own, message_id = pop_new()
+                if message_id > limit:
+                    message_ids.append(message_id)
+                    message_count += 1
+                    if message_count == 100:
+                        break
+                    continue
                 
-                # We really have at least 1 message at that interval.
-                own, message_id = message_group_new.popleft()
-                # We will delete that message with old endpoint if not own, to make
-                # Sure it will not block the other endpoint for 2 minutes with any chance.
+                # The message got too old meanwhile, so move it to the respective old group.
                 if own:
-                    delete_new_task = Task(self.http.message_delete(channel_id, message_id, None), KOKORO)
+                    add_old_own(message_id)
                 else:
-                    delete_old_task = Task(self.http.message_delete_b2wo(channel_id, message_id, None), KOKORO)
-                
-                tasks.append(delete_old_task)
+                    add_old(message_id)
+                continue
             
-            done, pending = await WaitTillFirst(tasks, KOKORO)
+            if message_count == 0:
+                continue
             
-            for task in done:
-                tasks.remove(task)
-                try:
-                    result = task.result()
-                except (DiscordException, ConnectionError):
-                    for task in tasks:
-                        task.cancel()
-                    raise
-                
-                if task is delete_mass_task:
-                    delete_mass_task = None
-                    continue
-                
-                if task is delete_new_task:
-                    delete_new_task = None
-                    continue
-                
-                if task is delete_old_task:
-                    delete_old_task = None
-                    continue
-                 
-                # Should not happen
+            # A single message cannot be bulk deleted. At this case the new group is empty as well, so no need to loop.
+            if message_count == 1:
+                await self.http.message_delete(channel_id, message_ids[0], None)
                 continue
+            
+            await self.http.message_delete_multiple(channel_id, _encode_message_delete_multiple_data(message_ids), None)
+    
+    async def _message_delete_multiple_new(self, channel_id, message_group_new, message_group_old_own, reason):
+        """
+        Called by ``.message_delete_multiple`` parallelly with ``._message_delete_multiple_mass`` and with
+        ``._message_delete_multiple_old``.
+        
+        Deletes the messages one by one with the endpoint of the messages younger than 2 weeks. Own messages older than
+        2 weeks are deleted with this endpoint as well.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        channel_id : `int`
+            The messages' channel's id.
+        message_group_new : `list` of `tuple` (`bool`, `int`)
+            `own` - `message_id` pairs of the messages, which are younger than 2 weeks.
+        message_group_old_own : `list` of `int`
+            The messages' identificators, which are older than 2 weeks and are own.
+        reason : `None` or `str`
+            Shows up at the respective guild's audit logs.
+        
+        Raises
+        ------
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        while True:
+            if message_group_new:
+                own, message_id = message_group_new.pop()
+            elif message_group_old_own:
+                message_id = message_group_old_own.pop()
+            else:
+                break
+            
+            await self.http.message_delete(channel_id, message_id, reason)
+    
+    async def _message_delete_multiple_old(self, channel_id, message_group_old, reason):
+        """
+        Called by ``.message_delete_multiple`` parallelly with ``._message_delete_multiple_mass`` and with
+        ``._message_delete_multiple_new``.
+        
+        Deletes the not own messages older than 2 weeks one by one.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        channel_id : `int`
+            The messages' channel's id.
+        message_group_old : `list` of `int`
+            The messages' identificators, which are older than 2 weeks and are not own.
+        reason : `None` or `str`
+            Shows up at the respective guild's audit logs.
+        
+        Raises
+        ------
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        while message_group_old:
+            message_id = message_group_old.pop()
+            await self.http.message_delete_b2wo(channel_id, message_id, reason)
     
     # deletes from more channel
     async def message_delete_multiple2(self, messages, reason=None):
         """
         Similar to ``.message_delete_multiple`, but it accepts messages from different channels. Groups them up by
-        channel and creates ``.message_delete_multiple`` tasks for them. Returns when all the task are finished.
-        If any exception was rasised meanwhile, then returns each of them in a list.
+        channel and creates ``.message_delete_multiple`` tasks for them, running maximum `16` of them at the same time.
+        Returns when all the task are finished. If any exception was rasised meanwhile, then returns each of them in a
+        list.
         
         This method is a coroutine.
         
@@ -3896,26 +4594,37 @@ class Client(UserBase):
             except KeyError:
                 delete_system[channel_id] = [message]
         
-        tasks = []
-        for messages in delete_system.values():
-            task=Task(self.message_delete_multiple(messages, reason), KOKORO)
-            tasks.append(task)
-        
-        await WaitTillAll(tasks, KOKORO)
-        
         exceptions = []
-        for task in tasks:
-            exception = task.exception()
-            if exception is None:
-                continue
-            
-            exceptions.append(exceptions)
-            if  __debug__:
-                task.__silence__()
+        async with ScarletExecutor(MULTI_CHANNEL_MESSAGE_DELETE_PARALLELISM) as scarlet:
+            for messages in delete_system.values():
+                await scarlet.add(self._message_delete_multiple_collecting(messages, reason, exceptions))
         
         if exceptions:
             return exceptions
+    
+    async def _message_delete_multiple_collecting(self, messages, reason, exceptions):
+        """
+        Called by ``.message_delete_multiple2`` for each channel. Deletes the given messages and collects the occurred
+        exception instead of propagating it, so the deletion at the other channels is not cancelled.
         
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        messages : `list` of ``Message`` objects
+            The messages to delete from the same channel.
+        reason : `None` or `str`
+            Shows up at the respective guild's audit logs.
+        exceptions : `list` of `BaseException` instances
+            The occurred exceptions.
+        """
+        try:
+            await self.message_delete_multiple(messages, reason)
+        except CancelledError:
+            raise
+        except BaseException as err:
+            exceptions.append(err)
+    
     async def message_delete_sequence(self, channel, after=None, before=None, limit=None, filter=None, reason=None):
         """
         Deletes messages between an intervallum determined by `before` and `after`. They can be passed as `int`, or as
@@ -3937,6 +4646,8 @@ class Client(UserBase):
             The maximal amount of messages to delete.
         filter : `callable`, Optional
             A callable filter, what should accept a message object as argument and return either `True` or `False`.
+            
+            If given as ``MessageAuthorFilter``, the message's author is checked without creating the message.
         reason : `None` or `str`, Optional
             Shows up at the respective guild's audit logs.
         
@@ -3982,146 +4693,181 @@ class Client(UserBase):
         
         last_message_id = before
         
+        # Author filters can be checked on the received message data directly.
+        if isinstance(filter, MessageAuthorFilter):
+            filter_author_id = filter.author_id
+        else:
+            filter_author_id = None
+        
+        # The limit to classify the messages with. Computed only once, since the messages classified as new are
+        # checked again before bulk deleting them and are moved to the old groups if they got too old meanwhile.
+        time_limit_new = (int(time_now()*1000.)-TWO_WEEKS_SNOWFLAKE_OFFSET)<<22 # 2 weeks
+        
         messages_ = channel.messages
         if (messages_ is not None) and messages_:
             before_index = message_relativeindex(messages_, before)
             after_index = message_relativeindex(messages_, after)
             if before_index != after_index:
-                time_limit = int((time_now()-1209600.)*1000.-DISCORD_EPOCH)<<22
-                while True:
-                    if before_index == after_index:
-                        break
+                if filter is None:
+                    # Without filter every message of the range is collected, so we can cut the range at the limit up
+                    # front, instead of counting the messages one by one.
+                    if after_index-before_index > limit:
+                        after_index = before_index+limit
                     
-                    message_ = messages_[before_index]
-                    before_index += 1
+                    limit -= after_index-before_index
                     
-                    if (filter is not None):
-                        if not filter(message_):
-                            continue
+                    # The messages are ordered from the newest, so the new ones are at the start of the range. Split
+                    # the range at the time limit and classify the two parts as blocks.
+                    split_index = message_relativeindex(messages_, time_limit_new)
+                    if split_index < before_index:
+                        split_index = before_index
+                    elif split_index > after_index:
+                        split_index = after_index
                     
-                    last_message_id = message_.id
-                    own = (message_.author is self)
-                    if last_message_id > time_limit:
-                        message_group_new.append((own, last_message_id,),)
-                    else:
-                        if own:
-                            group = message_group_old_own
-                        else:
-                            group = message_group_old
-                        group.append(last_message_id)
+                    message_group_new.extend([(message_.author is self, message_.id) for message_ in
+                        islice(messages_, before_index, split_index)])
                     
-                    # Check if we reached the limit
-                    limit -= 1
-                    if limit:
-                        continue
+                    messages_old = list(islice(messages_, split_index, after_index))
+                    message_group_old_own.extend([message_.id for message_ in messages_old if
+                        (message_.author is self)])
+                    message_group_old.extend([message_.id for message_ in messages_old if
+                        (message_.author is not self)])
                     
+                    last_message_id = messages_[after_index-1].id
+                
+                else:
+                    # Indexing a deque walks it from the nearer end, so iterate over the range instead.
+                    for message_ in islice(messages_, before_index, after_index):
+                        # Check if we reached the limit
+                        if not limit:
+                            break
+                        
+                        if not filter(message_):
+                            continue
+                        
+                        limit -= 1
+                        
+                        last_message_id = message_.id
+                        own = (message_.author is self)
+                        if last_message_id > time_limit_new:
+                            message_group_new.append((own, last_message_id,),)
+                        else:
+                            if own:
+                                group = message_group_old_own
+                            else:
+                                group = message_group_old
+                            group.append(last_message_id)
+                
+                if not limit:
                     should_request = False
-                    break
         
-        tasks = []
+        # Persistent waiter, yielding the finished tasks one by one.
+        waiter = WaitContinously(None, KOKORO)
         
         get_mass_task = None
         delete_mass_task = None
-        delete_new_task = None
-        delete_old_task = None
+        # Single message deletions are pipelined, since the ratelimit handler lets through only as much as allowed.
+        delete_new_tasks = set()
+        delete_old_tasks = set()
+        # Maps the single message deletion tasks to the set they are in.
+        task_slots = {}
         
         channel_id = channel.id
         
+        # Only one message logs request is running at a time, so we can reuse the same request data.
+        request_data = {
+            'limit': 100,
+            'before': 0,
+                }
+        
         while True:
             if should_request and (get_mass_task is None):
-                request_data = {
-                    'limit': 100,
-                    'before': last_message_id,
-                        }
-                
+                request_data['before'] = last_message_id
                 get_mass_task = Task(self.http.message_logs(channel_id, request_data), KOKORO)
-                tasks.append(get_mass_task)
+                waiter.add(get_mass_task)
             
             if (delete_mass_task is None):
                 message_limit = len(message_group_new)
                 # If there are more messages, we are waiting for other tasks
                 if message_limit:
-                    time_limit = int((time_now()-1209590.)*1000.-DISCORD_EPOCH)<<22 # 2 weeks -10s
-                    collected = 0
+                    time_limit = (int(time_now()*1000.)-TWO_WEEKS_SAFE_SNOWFLAKE_OFFSET)<<22 # 2 weeks -10s
                     
-                    while True:
-                        if collected == message_limit:
-                            break
-                        
-                        if collected == 100:
-                            break
-                        
-                        own, message_id = message_group_new[collected]
-                        if message_id < time_limit:
-                            break
-                        
-                        collected += 1
-                        continue
+                    # The messages are ordered from the newest, so if the last one of the batch is new enough, all
+                    # of them are, and we do not need to check them one by one.
+                    if message_limit > 100:
+                        message_limit = 100
+                    
+                    if message_group_new[message_limit-1][1] < time_limit:
+                        collected = 0
+                        while True:
+                            own, message_id = message_group_new[collected]
+                            if message_id < time_limit:
+                                break
+                            
+                            collected += 1
+                            continue
+                    else:
+                        collected = message_limit
                     
                     if collected == 0:
                         pass
                     
                     elif collected == 1:
                         # Delete the message if we dont delete a new message already
-                        if (delete_new_task is None):
+                        if len(delete_new_tasks) < SEQUENCE_MESSAGE_DELETE_PARALLELISM:
                             # We collected 1 message -> We cannot use mass delete on this.
                             own, message_id = message_group_new.popleft()
-                            delete_new_task = Task(self.http.message_delete(channel_id, message_id, reason=reason),
-                                KOKORO)
-                            tasks.append(delete_new_task)
+                            task = Task(self.http.message_delete(channel_id, message_id, reason=reason), KOKORO)
+                            delete_new_tasks.add(task)
+                            task_slots[task] = delete_new_tasks
+                            waiter.add(task)
                     else:
-                        message_ids = []
-                        while collected:
-                            collected -= 1
-                            own, message_id = message_group_new.popleft()
-                            message_ids.append(message_id)
+                        popleft = message_group_new.popleft
+                        message_ids = [popleft()[1] for x in range(collected)]
                         
-                        delete_mass_task = Task(self.http.message_delete_multiple(channel_id, {'messages': message_ids},
-                            reason=reason), KOKORO)
-                        tasks.append(delete_mass_task)
+                        delete_mass_task = Task(self.http.message_delete_multiple(channel_id,
+                            _encode_message_delete_multiple_data(message_ids), reason=reason), KOKORO)
+                        waiter.add(delete_mass_task)
                     
                     # After we checked what is at this group, lets move the others from it's end, if needed ofc
-                    message_limit = len(message_group_new)
-                    if message_limit:
-                        # timelimit -> 2 week
-                        time_limit = time_limit-20971520000
+                    # timelimit -> 2 week
+                    time_limit_old = time_limit-20971520000
+                    if message_group_new and (message_group_new[-1][1] <= time_limit_old):
+                        # Pop the messages to move from the end, then extend the old groups with them at once.
+                        # `extendleft` reverses them, so they stay ordered from the newest.
+                        pop = message_group_new.pop
+                        moved = []
+                        while message_group_new and (message_group_new[-1][1] <= time_limit_old):
+                            moved.append(pop())
                         
-                        while True:
-                            # Cannot start at index = len(...), so we instantly do -1
-                            message_limit -= 1
-                            
-                            own, message_id = message_group_new[message_limit]
-                            # Check if we should not move -> leave
-                            if message_id > time_limit:
-                                break
-                            
-                            del message_group_new[message_limit]
-                            if own:
-                                group = message_group_old_own
-                            else:
-                                group = message_group_old
-                                
-                            group.appendleft(message_id)
-                            
-                            if message_limit:
-                                continue
-                            
-                            break
-            
-            if (delete_new_task is None):
-                # Check old own messages only, mass delete speed is pretty good by itself.
-                if message_group_old_own:
-                    message_id = message_group_old_own.popleft()
-                    delete_new_task = Task(self.http.message_delete(channel_id, message_id, reason=reason), KOKORO)
-                    tasks.append(delete_new_task)
+                        message_group_old_own.extendleft([message_id for own, message_id in moved if own])
+                        message_group_old.extendleft([message_id for own, message_id in moved if not own])
             
-            if (delete_old_task is None):
-                if message_group_old:
-                    message_id = message_group_old.popleft()
-                    delete_old_task = Task(self.http.message_delete_b2wo(channel_id, message_id, reason=reason), KOKORO)
-                    tasks.append(delete_old_task)
-            
-            if not tasks:
+            # Check old own messages only, mass delete speed is pretty good by itself.
+            # The tasks to start are created together, then registered in bulk.
+            start_count = min(len(message_group_old_own), SEQUENCE_MESSAGE_DELETE_PARALLELISM-len(delete_new_tasks))
+            if start_count > 0:
+                popleft = message_group_old_own.popleft
+                message_delete = self.http.message_delete
+                tasks = [Task(message_delete(channel_id, popleft(), reason=reason), KOKORO) for x in range(start_count)]
+                delete_new_tasks.update(tasks)
+                task_slots.update(dict.fromkeys(tasks, delete_new_tasks))
+                for task in tasks:
+                    waiter.add(task)
+            
+            start_count = min(len(message_group_old), SEQUENCE_MESSAGE_DELETE_PARALLELISM-len(delete_old_tasks))
+            if start_count > 0:
+                popleft = message_group_old.popleft
+                message_delete_b2wo = self.http.message_delete_b2wo
+                tasks = [Task(message_delete_b2wo(channel_id, popleft(), reason=reason), KOKORO) for x in
+                    range(start_count)]
+                delete_old_tasks.update(tasks)
+                task_slots.update(dict.fromkeys(tasks, delete_old_tasks))
+                for task in tasks:
+                    waiter.add(task)
+            
+            if (get_mass_task is None) and (delete_mass_task is None) and (not delete_new_tasks) and \
+                    (not delete_old_tasks):
                 # It can happen, that there are no more tasks left, at that case we check if there is more message
                 # left. Only at `message_group_new` can be anymore message, because there is a time intervallum of
                 # 10 seconds, what we do not move between categories.
@@ -4132,118 +4878,90 @@ class Client(UserBase):
                 own, message_id = message_group_new.popleft()
                 # We will delete that message with old endpoint if not own, to make sure it will not block the other
                 # endpoint for 2 minutes with any chance.
+                # Nothing else is running, so we can await the request directly, without creating a task for it.
                 if own:
-                    delete_new_task = Task(self.http.message_delete(channel_id, message_id, reason=reason), KOKORO)
-                    task = delete_new_task
+                    await self.http.message_delete(channel_id, message_id, reason=reason)
                 else:
-                    delete_old_task = Task(self.http.message_delete_b2wo(channel_id, message_id, reason=reason), KOKORO)
-                    task = delete_old_task
+                    await self.http.message_delete_b2wo(channel_id, message_id, reason=reason)
                 
-                tasks.append(task)
+                continue
             
-            done, pending = await WaitTillFirst(tasks, KOKORO)
+            try:
+                task = await waiter
+                waiter.reset()
+                result = task.result()
+            except:
+                waiter.cancel()
+                raise
             
-            for task in done:
-                tasks.remove(task)
-                try:
-                    result = task.result()
-                except:
-                    for task in tasks:
-                        task.cancel()
-                    raise
+            if task is get_mass_task:
+                get_mass_task = None
                 
-                if task is get_mass_task:
-                    get_mass_task = None
+                received_count = len(result)
+                if received_count < 100:
+                    should_request = False
                     
-                    received_count = len(result)
-                    if received_count < 100:
-                        should_request = False
-                        
-                        # We got 0 messages, move on the next task
-                        if received_count == 0:
-                            continue
+                    # We got 0 messages, move on the next task
+                    if received_count == 0:
+                        continue
+                
+                # Bind the appends and the message creator once, since they are called for every message.
+                append_new = message_group_new.append
+                append_old = message_group_old.append
+                append_old_own = message_group_old_own.append
+                create_unknown_message = channel._create_unknown_message
+                client_id = self.id
+                
+                for message_data in result:
+                    last_message_id = int(message_data['id'])
                     
-                    # We dont really care about the limit, because we check message id when we delete too.
-                    time_limit = int((time_now()-1209600.)*1000.-DISCORD_EPOCH)<<22 # 2 weeks
+                    # Did we reach the after limit? Checked before anything else, so we do not create a message for
+                    # nothing.
+                    if last_message_id < after:
+                        should_request = False
+                        break
                     
-                    for message_data in result:
-                        if (filter is None):
-                            last_message_id = int(message_data['id'])
-    
-                            # Did we reach the after limit?
-                            if last_message_id < after:
-                                should_request = False
-                                break
-                            
-                            # If filter is `None`, we just have to decide, if we were the author or nope.
-                            
-                            # Try to get user id, first start it with trying to get author data. The default author_id
-                            # will be 0, because thats sure not the id of the client.
-                            try:
-                                author_data = message_data['author']
-                            except KeyError:
-                                author_id = 0
-                            else:
-                                # If we have author data, lets select the user's data from it
-                                try:
-                                    user_data = author_data['user']
-                                except KeyError:
-                                    user_data = author_data
-                                
-                                try:
-                                    author_id = user_data['id']
-                                except KeyError:
-                                    author_id = 0
-                                else:
-                                    author_id = int(author_id)
-                        else:
-                            message_ = channel._create_unknown_message(message_data)
-                            last_message_id = message_.id
-                            
-                            # Did we reach the after limit?
-                            if last_message_id < after:
-                                should_request = False
-                                break
-                            
-                            if not filter(message_):
-                                continue
-                            
-                            author_id = message_.author.id
-                        
-                        own = (author_id == self.id)
-                        
-                        if last_message_id > time_limit:
-                            message_group_new.append((own, last_message_id,),)
-                        else:
-                            if own:
-                                group = message_group_old_own
-                            else:
-                                group = message_group_old
-                            
-                            group.append(last_message_id)
-                        
-                        # Did we reach the amount limit?
-                        limit -= 1
-                        if limit:
+                    if (filter is None):
+                        # If filter is `None`, we just have to decide, if we were the author or nope.
+                        author_id = _get_message_data_author_id(message_data)
+                    elif (filter_author_id is not None):
+                        # Author filter, we can check it on the data directly.
+                        author_id = _get_message_data_author_id(message_data)
+                        if author_id != filter_author_id:
+                            continue
+                    else:
+                        message_ = create_unknown_message(message_data)
+                        if not filter(message_):
                             continue
                         
-                        should_request = False
-                        break
-                
-                if task is delete_mass_task:
-                    delete_mass_task = None
-                    continue
-                
-                if task is delete_new_task:
-                    delete_new_task = None
-                    continue
+                        author_id = message_.author.id
+                    
+                    own = (author_id == client_id)
+                    
+                    if last_message_id > time_limit_new:
+                        append_new((own, last_message_id,),)
+                    elif own:
+                        append_old_own(last_message_id)
+                    else:
+                        append_old(last_message_id)
+                    
+                    # Did we reach the amount limit?
+                    limit -= 1
+                    if limit:
+                        continue
+                    
+                    should_request = False
+                    break
                 
-                if task is delete_old_task:
-                    delete_old_task = None
-                    continue
-                 
-                # Should not happen
                 continue
+            
+            if task is delete_mass_task:
+                delete_mass_task = None
+                continue
+            
+            # Every other task is a single message deletion, so free up it's slot.
+            task_slots.pop(task).remove(task)
+            continue
     
     async def multi_client_message_delete_sequence(self, channel, after=None, before=None, limit=None, filter=None,
             reason=None):
@@ -4270,6 +4988,8 @@ class Client(UserBase):
             The maximal amount of messages to delete.
         filter : `callable`, Optional
             A callable filter, what should accept a message object as argument and return either `True` or `False`.
+            
+            If given as ``MessageAuthorFilter``, the message's author is checked without creating the message.
         reason : `None` or `str`, Optional
             Shows up at the respective guild's audit logs.
         
@@ -4299,11 +5019,10 @@ class Client(UserBase):
         
         if not sharders:
             return
-        
-        for sharder in sharders:
-            if sharder.can_manage_messages:
-                break
-        else:
+        
+        # Permissions are not re-checked meanwhile, so collect the sharders, who can manage messages once.
+        manage_sharders = [sharder for sharder in sharders if sharder.can_manage_messages]
+        if not manage_sharders:
             return
         
         before = 9223372036854775807 if before is None else log_time_converter(before)
@@ -4335,53 +5054,96 @@ class Client(UserBase):
         
         last_message_id = before
         
-        is_own_getter = {}
-        for index in range(len(sharders)):
-            is_own_getter[sharders[index].client.id] = index
+        # Author filters can be checked on the received message data directly.
+        if isinstance(filter, MessageAuthorFilter):
+            filter_author_id = filter.author_id
+        else:
+            filter_author_id = None
+        
+        # Maps the clients' ids to their sharder's index. Bound `.get` once, since it is called for every message.
+        is_own_getter = {sharders[index].client.id: index for index in range(len(sharders))}.get
+        
+        # The limit to classify the messages with. Computed only once, since the messages classified as new are
+        # checked again before bulk deleting them and are moved to the old groups if they got too old meanwhile.
+        time_limit_new = (int(time_now()*1000.)-TWO_WEEKS_SNOWFLAKE_OFFSET)<<22 # 2 weeks
         
         messages_ = channel.messages
         if (messages_ is not None) and messages_:
             before_index = message_relativeindex(messages_, before)
             after_index = message_relativeindex(messages_, after)
             if before_index != after_index:
-                time_limit = int((time_now()-1209600.)*1000.-DISCORD_EPOCH)<<22
-                while True:
-                    if before_index == after_index:
-                        break
+                if filter is None:
+                    # Without filter every message of the range is collected, so we can cut the range at the limit up
+                    # front, instead of counting the messages one by one.
+                    if after_index-before_index > limit:
+                        after_index = before_index+limit
                     
-                    message_ = messages_[before_index]
-                    before_index += 1
+                    limit -= after_index-before_index
                     
-                    if (filter is not None):
-                        if not filter(message_):
-                            continue
+                    # The messages are ordered from the newest, so the new ones are at the start of the range. Split
+                    # the range at the time limit and classify the two parts as blocks.
+                    split_index = message_relativeindex(messages_, time_limit_new)
+                    if split_index < before_index:
+                        split_index = before_index
+                    elif split_index > after_index:
+                        split_index = after_index
                     
-                    last_message_id = message_.id
-                    whos = is_own_getter.get(message_.author.id, -1)
-                    if last_message_id > time_limit:
-                        message_group_new.append((whos, last_message_id,),)
-                    else:
+                    message_group_new.extend([(is_own_getter(message_.author.id, -1), message_.id) for message_ in
+                        islice(messages_, before_index, split_index)])
+                    
+                    for message_ in islice(messages_, split_index, after_index):
+                        whos = is_own_getter(message_.author.id, -1)
                         if whos == -1:
-                            message_group_old.append(last_message_id)
+                            message_group_old.append(message_.id)
                         else:
-                            message_group_old_own.append((whos, last_message_id,),)
-                    
-                    # Check if we reached the limit
-                    limit -= 1
-                    if limit:
-                        continue
+                            message_group_old_own.append((whos, message_.id,),)
                     
+                    last_message_id = messages_[after_index-1].id
+                
+                else:
+                    # Indexing a deque walks it from the nearer end, so iterate over the range instead.
+                    for message_ in islice(messages_, before_index, after_index):
+                        # Check if we reached the limit
+                        if not limit:
+                            break
+                        
+                        if not filter(message_):
+                            continue
+                        
+                        limit -= 1
+                        
+                        last_message_id = message_.id
+                        whos = is_own_getter(message_.author.id, -1)
+                        if last_message_id > time_limit_new:
+                            message_group_new.append((whos, last_message_id,),)
+                        else:
+                            if whos == -1:
+                                message_group_old.append(last_message_id)
+                            else:
+                                message_group_old_own.append((whos, last_message_id,),)
+                
+                if not limit:
                     should_request = False
-                    break
         
-        tasks = []
+        # Persistent waiter, yielding the finished tasks one by one.
+        waiter = WaitContinously(None, KOKORO)
         # Handle requesting together, since we need to know, till where the last request yielded.
         get_mass_task = None
+        # Maps the delete tasks to the sharder, which is executing them.
+        task_sharders = {}
+        # The sharders, who can manage messages and are not bulk deleting messages.
+        mass_ready_sharders = deque(manage_sharders)
         # Loop the sharders when requesting, so ratelimits are used up.
         get_mass_task_next = 0
         
         channel_id = channel.id
         
+        # Only one message logs request is running at a time, so we can reuse the same request data.
+        request_data = {
+            'limit': 100,
+            'before': 0,
+                }
+        
         while True:
             if should_request and (get_mass_task is None):
                 # Will break since `should_request` is set to `True` only if at least of the sharders have
@@ -4397,87 +5159,75 @@ class Client(UserBase):
                     get_mass_task_next += 1
                     continue
                 
-                request_data = {
-                    'limit': 100,
-                    'before': last_message_id,
-                        }
-                
-                get_mass_task = Task(sharder.client.http.message_logs(channel_id, request_data), KOKORO)
-                tasks.append(get_mass_task)
+                request_data['before'] = last_message_id
+                get_mass_task = Task(sharder.http.message_logs(channel_id, request_data), KOKORO)
+                waiter.add(get_mass_task)
             
-            for sharder in sharders:
-                if (sharder.can_manage_messages) and (sharder.delete_mass_task is None):
-                    message_limit = len(message_group_new)
-                    # If there are more messages, we are waiting for other tasks
-                    if message_limit:
-                        time_limit = int((time_now()-1209590.)*1000.-DISCORD_EPOCH)<<22 # 2 weeks -10s
-                        collected = 0
-                        
-                        while True:
-                            if collected == message_limit:
-                                break
-                            
-                            if collected == 100:
-                                break
-                            
-                            whos, message_id = message_group_new[collected]
-                            if message_id < time_limit:
-                                break
-                            
-                            collected += 1
-                            continue
-                        
-                        if collected == 0:
-                            pass
-                        
-                        elif collected == 1:
-                            # Delete the message if we dont delete a new message already
-                            for sub_sharder in sharders:
-                                if (sub_sharder.can_manage_messages) and (sharder.delete_new_task is None):
-                                    # We collected 1 message -> We cannot use mass delete on this.
-                                    whos, message_id = message_group_new.popleft()
-                                    delete_new_task = Task(sub_sharder.client.http.message_delete(channel_id,
-                                        message_id, reason=reason), KOKORO)
-                                    sub_sharder.delete_new_task = delete_new_task
-                                    tasks.append(delete_new_task)
-                                    break
-                        else:
-                            message_ids = []
-                            while collected:
-                                collected -= 1
-                                whos, message_id = message_group_new.popleft()
-                                message_ids.append(message_id)
-                            
-                            delete_mass_task = Task(sharder.client.http.message_delete_multiple(channel_id,
-                                {'messages': message_ids}, reason=reason), KOKORO)
-                            sharder.delete_mass_task = delete_mass_task
-                            tasks.append(delete_mass_task)
+            # Calculated once for every sharder, since they do not wait between each other.
+            time_limit = (int(time_now()*1000.)-TWO_WEEKS_SAFE_SNOWFLAKE_OFFSET)<<22 # 2 weeks -10s
+            
+            while mass_ready_sharders and message_group_new:
+                message_limit = len(message_group_new)
+                # The messages are ordered from the newest, so if the last one of the batch is new enough, all
+                # of them are, and we do not need to check them one by one.
+                if message_limit > 100:
+                    message_limit = 100
+                
+                if message_group_new[message_limit-1][1] < time_limit:
+                    collected = 0
+                    while True:
+                        whos, message_id = message_group_new[collected]
+                        if message_id < time_limit:
+                            break
                         
-                        # After we checked what is at this group, lets move the others from it's end, if needed ofc
-                        message_limit = len(message_group_new)
-                        if message_limit:
-                            # timelimit -> 2 week
-                            time_limit = time_limit-20971520000
-                            
-                            while True:
-                                # Cannot start at index = len(...), so we instantly do -1
-                                message_limit -= 1
-                                
-                                whos, message_id = message_group_new[message_limit]
-                                # Check if we should not move -> leave
-                                if message_id > time_limit:
-                                    break
-                                
-                                del message_group_new[message_limit]
-                                if whos == -1:
-                                    message_group_old.appendleft(message_id)
-                                else:
-                                    message_group_old_own.appendleft((whos, message_group_old,),)
-                                
-                                if message_limit:
-                                    continue
-                                
-                                break
+                        collected += 1
+                        continue
+                else:
+                    collected = message_limit
+                
+                if collected == 0:
+                    pass
+                
+                elif collected == 1:
+                    # Delete the message if we dont delete a new message already
+                    for sub_sharder in manage_sharders:
+                        if (sub_sharder.delete_new_task is None):
+                            # We collected 1 message -> We cannot use mass delete on this.
+                            whos, message_id = message_group_new.popleft()
+                            delete_new_task = Task(sub_sharder.http.message_delete(channel_id,
+                                message_id, reason=reason), KOKORO)
+                            sub_sharder.delete_new_task = delete_new_task
+                            task_sharders[delete_new_task] = sub_sharder
+                            waiter.add(delete_new_task)
+                            break
+                else:
+                    popleft = message_group_new.popleft
+                    message_ids = [popleft()[1] for x in range(collected)]
+                    
+                    sharder = mass_ready_sharders.popleft()
+                    delete_mass_task = Task(sharder.http.message_delete_multiple(channel_id,
+                        _encode_message_delete_multiple_data(message_ids), reason=reason), KOKORO)
+                    sharder.delete_mass_task = delete_mass_task
+                    task_sharders[delete_mass_task] = sharder
+                    waiter.add(delete_mass_task)
+                
+                # After we checked what is at this group, lets move the others from it's end, if needed ofc
+                # timelimit -> 2 week
+                time_limit_old = time_limit-20971520000
+                if message_group_new and (message_group_new[-1][1] <= time_limit_old):
+                    # Pop the messages to move from the end, then extend the old groups with them at once.
+                    # `extendleft` reverses them, so they stay ordered from the newest.
+                    pop = message_group_new.pop
+                    moved = []
+                    while message_group_new and (message_group_new[-1][1] <= time_limit_old):
+                        moved.append(pop())
+                    
+                    message_group_old_own.extendleft([element for element in moved if element[0] != -1])
+                    message_group_old.extendleft([message_id for whos, message_id in moved if whos == -1])
+                
+                # If no bulk delete was started, the other sharders would not find anything to bulk delete either.
+                if collected < 2:
+                    break
             
             # Check old own messages only, mass delete speed is pretty good by itself.
             if message_group_old_own:
@@ -4488,24 +5238,27 @@ class Client(UserBase):
                 sharder = sharders[whos]
                 if sharder.delete_new_task is None:
                     del message_group_old_own[0]
-                    delete_new_task = Task(sharder.client.http.message_delete(channel_id, message_id,
+                    delete_new_task = Task(sharder.http.message_delete(channel_id, message_id,
                         reason=reason), KOKORO)
                     sharder.delete_new_task = delete_new_task
-                    tasks.append(delete_new_task)
+                    task_sharders[delete_new_task] = sharder
+                    waiter.add(delete_new_task)
             
             if message_group_old:
-                for sharder in sharders:
+                for sharder in manage_sharders:
                     if (sharder.delete_old_task is None):
                         message_id = message_group_old.popleft()
-                        delete_old_task = Task(sharder.client.http.message_delete_b2wo(channel_id, message_id,
+                        delete_old_task = Task(sharder.http.message_delete_b2wo(channel_id, message_id,
                             reason=reason), KOKORO)
                         sharder.delete_old_task = delete_old_task
-                        tasks.append(delete_old_task)
+                        task_sharders[delete_old_task] = sharder
+                        waiter.add(delete_old_task)
                         
                         if not message_group_old:
                             break
             
-            if not tasks:
+            # `task_sharders` contains every running delete task.
+            if (get_mass_task is None) and (not task_sharders):
                 # It can happen, that there are no more tasks left, at that case we check if there is more message
                 # left. Only at `message_group_new` can be anymore message, because there is a time intervallum of
                 # 10 seconds, what we do not move between categories.
@@ -4516,122 +5269,93 @@ class Client(UserBase):
                 whos, message_id = message_group_new.popleft()
                 # We will delete that message with old endpoint if not own, to make sure it will not block the other
                 # endpoint for 2 minutes with any chance.
+                # Nothing else is running, so we can await the request directly, without creating a task for it.
                 if whos == -1:
-                    for sharder in sharders:
-                        if sharder.can_manage_messages:
-                            task = Task(sharder.client.http.message_delete_b2wo(channel_id, message_id,
-                                reason=reason), KOKORO)
-                            sharder.delete_old_task = task
-                            break
+                    await manage_sharders[0].http.message_delete_b2wo(channel_id, message_id, reason=reason)
                 else:
-                    sharder = sharders[whos]
-                    task = Task(sharder.client.http.message_delete(channel_id, message_id, reason=reason), KOKORO)
-                    sharder.delete_new_task = task
+                    await sharders[whos].http.message_delete(channel_id, message_id, reason=reason)
                 
-                tasks.append(task)
+                continue
             
-            done, pending = await WaitTillFirst(tasks, KOKORO)
+            try:
+                task = await waiter
+                waiter.reset()
+                result = task.result()
+            except:
+                waiter.cancel()
+                raise
             
-            for task in done:
-                tasks.remove(task)
-                try:
-                    result = task.result()
-                except:
-                    for task in tasks:
-                        task.cancel()
-                    raise
+            if task is get_mass_task:
+                get_mass_task = None
                 
-                if task is get_mass_task:
-                    get_mass_task = None
+                received_count = len(result)
+                if received_count < 100:
+                    should_request = False
                     
-                    received_count = len(result)
-                    if received_count < 100:
-                        should_request = False
-                        
-                        # We got 0 messages, move on the next task
-                        if received_count == 0:
-                            continue
+                    # We got 0 messages, move on the next task
+                    if received_count == 0:
+                        continue
+                
+                # Bind the appends and the message creator once, since they are called for every message.
+                append_new = message_group_new.append
+                append_old = message_group_old.append
+                append_old_own = message_group_old_own.append
+                create_unknown_message = channel._create_unknown_message
+                
+                for message_data in result:
+                    last_message_id = int(message_data['id'])
                     
-                    # We dont really care about the limit, because we check message id when we delete too.
-                    time_limit = int((time_now()-1209600.)*1000.-DISCORD_EPOCH)<<22 # 2 weeks
+                    # Did we reach the after limit? Checked before anything else, so we do not create a message for
+                    # nothing.
+                    if last_message_id < after:
+                        should_request = False
+                        break
                     
-                    for message_data in result:
-                        if (filter is None):
-                            last_message_id = int(message_data['id'])
-                            
-                            # Did we reach the after limit?
-                            if last_message_id < after:
-                                should_request = False
-                                break
-                            
-                            # If filter is `None`, we just have to decide, if we were the author or nope.
-                            
-                            # Try to get user id, first start it with trying to get author data. The default author_id
-                            # will be 0, because thats sure not the id of the client.
-                            try:
-                                author_data = message_data['author']
-                            except KeyError:
-                                author_id = 0
-                            else:
-                                # If we have author data, lets select the user's data from it
-                                try:
-                                    user_data = author_data['user']
-                                except KeyError:
-                                    user_data = author_data
-                                
-                                try:
-                                    author_id = user_data['id']
-                                except KeyError:
-                                    author_id = 0
-                                else:
-                                    author_id = int(author_id)
-                        else:
-                            message_ = channel._create_unknown_message(message_data)
-                            last_message_id = message_.id
-                            
-                            # Did we reach the after limit?
-                            if last_message_id < after:
-                                should_request = False
-                                break
-                            
-                            if not filter(message_):
-                                continue
-                            
-                            author_id = message_.author.id
-                        
-                        whos = is_own_getter.get(author_id, -1)
-                        
-                        if last_message_id > time_limit:
-                            message_group_new.append((whos, last_message_id,),)
-                        else:
-                            if whos == -1:
-                                message_group_old.append(last_message_id)
-                            else:
-                                message_group_old_own.append((whos, last_message_id,),)
-                        
-                        # Did we reach the amount limit?
-                        limit -= 1
-                        if limit:
+                    if (filter is None):
+                        # If filter is `None`, we just have to decide, if we were the author or nope.
+                        author_id = _get_message_data_author_id(message_data)
+                    elif (filter_author_id is not None):
+                        # Author filter, we can check it on the data directly.
+                        author_id = _get_message_data_author_id(message_data)
+                        if author_id != filter_author_id:
+                            continue
+                    else:
+                        message_ = create_unknown_message(message_data)
+                        if not filter(message_):
                             continue
                         
-                        should_request = False
-                        break
-                
-                for sharder in sharders:
-                    if task is sharder.delete_mass_task:
-                        sharder.delete_mass_task = None
-                        break
+                        author_id = message_.author.id
                     
-                    if task is sharder.delete_new_task:
-                        sharder.delete_new_task = None
-                        break
+                    whos = is_own_getter(author_id, -1)
                     
-                    if task is sharder.delete_old_task:
-                        sharder.delete_old_task = None
-                        break
+                    if last_message_id > time_limit_new:
+                        append_new((whos, last_message_id,),)
+                    elif whos == -1:
+                        append_old(last_message_id)
+                    else:
+                        append_old_own((whos, last_message_id,),)
+                    
+                    # Did we reach the amount limit?
+                    limit -= 1
+                    if limit:
+                        continue
+                    
+                    should_request = False
+                    break
                 
-                # Else case should happen.
                 continue
+            
+            # Every other task is a delete task, so free up it's slot at the sharder, who executed it.
+            sharder = task_sharders.pop(task)
+            if task is sharder.delete_mass_task:
+                sharder.delete_mass_task = None
+                mass_ready_sharders.append(sharder)
+            elif task is sharder.delete_new_task:
+                sharder.delete_new_task = None
+            else:
+                sharder.delete_old_task = None
+            
+            continue
     
     async def message_edit(self, message, content=..., *, embed=..., allowed_mentions=..., suppress=...):
         """
@@ -4730,7 +5454,7 @@ class Client(UserBase):
                             continue
                         
                         raise TypeError(f'`embed` was given as a `list`, but it\'s element under index `{index}` '
-                            f'is not `{EmbedBase.__name__}` instance, but {embed_element.__class__.__name__}`, got: '
+                            f'is not `{EmbedBase.__name__}` instance, but {element.__class__.__name__}`, got: '
                             f'{embed.__class__.__name__}.')
                 
                 embed = embed[0]
@@ -4741,14 +5465,17 @@ class Client(UserBase):
                 f'{EmbedBase.__name__} instances, got {embed.__class__.__name__}.')
         
         # Content check order:
-        # 1.: Elipsis
-        # 2.: None
-        # 3.: str
-        # 4.: Embed -> embed = content
-        # 5.: list of Embed -> embed = content[0]
-        # 6.: object -> str(content)
-        
-        if content is ...:
+        # 1.: str (exact type, the most common case)
+        # 2.: Elipsis
+        # 3.: None
+        # 4.: str (subclass)
+        # 5.: Embed -> embed = content
+        # 6.: list of Embed -> embed = content[0]
+        # 7.: object -> str(content)
+        
+        if type(content) is str:
+            pass
+        elif content is ...:
             pass
         elif content is None:
             content = ''
@@ -4762,26 +5489,20 @@ class Client(UserBase):
             embed = content
             content = ...
         else:
-            # Check for list of embeds as well.
-            if isinstance(content, (list, tuple)):
-                if content:
-                    for element in content:
-                        if isinstance(element, EmbedBase):
-                            continue
-                        
-                        is_list_of_embeds = False
-                        break
-                    else:
-                        is_list_of_embeds = True
-                else:
-                    is_list_of_embeds = False
-            else:
-                is_list_of_embeds = False
-            
-            if is_list_of_embeds:
+            # Check for list of embeds as well. Only the first embed is used, so checking only that is enough to
+            # decide. The other elements are validated only in debug mode.
+            if isinstance(content, (list, tuple)) and content and isinstance(content[0], EmbedBase):
                 if __debug__:
                     if (embed is not ...):
                         raise TypeError(f'Multiple embeds were given, got content={content!r}, embed={embed!r}.')
+                    
+                    for index, element in enumerate(content):
+                        if isinstance(element, EmbedBase):
+                            continue
+                        
+                        raise TypeError(f'`content` was given as a `list` of embeds, but it\'s element under index '
+                            f'`{index}` is not `{EmbedBase.__name__}` instance, but {element.__class__.__name__}`, '
+                            f'got: {content.__class__.__name__}.')
                 
                 embed = content[0]
                 content = ...
@@ -4804,12 +5525,8 @@ class Client(UserBase):
             message_data['allowed_mentions'] = self._parse_allowed_mentions(allowed_mentions)
         
         if (suppress is not ...):
-            flags = message.flags
-            if suppress:
-                flags |= 0b00000100
-            else:
-                flags &= 0b11111011
-            message_data['flags'] = flags
+            # Clear the `embeds_suppressed` bit, then set it back depending on `suppress`.
+            message_data['flags'] = (message.flags&0b11111011)|(bool(suppress)<<2)
         
         await self.http.message_edit(message.channel.id, message_id, message_data)
     
@@ -4920,23 +5637,43 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(channel, ChannelTextBase):
-            channel_id = channel.id
+        channel, channel_id = _resolve_text_channel(channel)
         
-        else:
-            channel_id = maybe_snowflake(channel)
-            if channel_id is None:
-                raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` or `int` instance, got '
-                    f'{channel.__class__.__name__}.')
-            
-            channel = CHANNELS.get(channel_id)
+        # Concurrent calls share the same request, but each of them receives it's own list.
+        messages = await self._coalesce_request(('channel_pins', channel_id), self._channel_pins, channel, channel_id)
+        return messages.copy()
+    
+    async def _channel_pins(self, channel, channel_id):
+        """
+        Requests the pinned messages of the given channel. Called by ``.channel_pins``.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        channel : `None` or ``ChannelTextBase`` instance
+            The channel from were the pinned messages will be requested.
+        channel_id : `int`
+            The channel's identifier.
+        
+        Returns
+        -------
+        messages : `list` of ``Message`` objects
         
+        Raises
+        ------
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
         data = await self.http.channel_pins(channel_id)
         
         if channel is None:
             channel = await self._maybe_get_channel(channel_id)
         
-        return [channel._create_unknown_message(message_data) for message_data in data]
+        create_unknown_message = channel._create_unknown_message
+        return [create_unknown_message(message_data) for message_data in data]
 
 
     async def _load_messages_till(self, channel, index):
@@ -4973,12 +5710,14 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
+        # Every request's `before` is the id of a message received by the previous one, so the requests cannot be
+        # pipelined, only done one after the other.
         while True:
             messages = channel.messages
             if messages is None:
                 ln = 0
             else:
-                ln = len(channel.messages)
+                ln = len(messages)
             
             loadto = index-ln
             
@@ -5027,6 +5766,8 @@ class Client(UserBase):
         ------
         TypeError
             If `channel` was not given neither as ``ChannelTextBase`` nor `int` instance.
+        IndexError
+            If the channel has no message at the given index.
         ConnectionError
             No internet connection.
         DiscordException
@@ -5042,27 +5783,56 @@ class Client(UserBase):
             if index < 0:
                 raise AssertionError(f'`index` is out from the expected [0:] range, got {index!r}.')
     
-        if isinstance(channel, ChannelTextBase):
-            pass
-        else:
-            channel_id = maybe_snowflake(channel)
-            if channel_id is None:
-                raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` or `int` instance, got '
-                    f'{channel.__class__.__name__}.')
-            
-            channel = CHANNELS.get(channel_id)
+        channel, channel_id = _resolve_text_channel(channel)
+        if (channel is not None):
+            messages = channel.messages
+            if (messages is not None) and (index < len(messages)):
+                return messages[index]
+        
+        # Concurrent calls of the same index share the same request.
+        return await self._coalesce_request(('message_at_index', channel_id, index), self._message_at_index, channel,
+            channel_id, index)
+    
+    async def _message_at_index(self, channel, channel_id, index):
+        """
+        Loads the messages of the given channel till the given index and returns the message at it. Called by
+        ``.message_at_index``.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        channel : `None` or ``ChannelTextBase`` instance
+            The channel from were the messages will be requested.
+        channel_id : `int`
+            The channel's identifier.
+        index : `int`
+            The index of the target message.
+        
+        Returns
+        -------
+        message : ``Message`` object
+        
+        Raises
+        ------
+        IndexError
+            If the channel has no message at the given index.
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        if channel is None:
+            messages = await self.message_logs_fromzero(channel_id, min(index+1, 100))
             
-            if channel is None:
-                messages = await self.message_logs_fromzero(channel_id, min(index+1, 100))
-                
-                if messages:
-                    channel = messages[0].channel
-                else:
-                    raise IndexError(index)
+            if messages:
+                channel = messages[0].channel
+            else:
+                raise IndexError(index)
         
         messages = channel.messages
         if (messages is not None) and (index < len(messages)):
-            raise IndexError(index)
+            return messages[index]
         
         if channel.message_history_reached_end:
             raise IndexError(index)
@@ -5124,32 +5894,28 @@ class Client(UserBase):
             if end < 0:
                 raise AssertionError(f'`end` is out from the expected [0:] range, got {end!r}.')
         
-        if isinstance(channel, ChannelTextBase):
-            pass
-        else:
-            channel_id = maybe_snowflake(channel)
-            if channel_id is None:
-                raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` or `int` instance, got '
-                    f'{channel.__class__.__name__}.')
-            
-            channel = CHANNELS.get(channel_id)
-            
-            if channel is None:
-                messages = await self.message_logs_fromzero(channel_id, min(end+1, 100))
-                
-                if messages:
-                    channel = messages[0].channel
-                else:
-                    return []
+        channel, channel_id = _resolve_text_channel(channel)
         
         if end <= start:
             return []
         
+        if channel is None:
+            messages = await self.message_logs_fromzero(channel_id, min(end+1, 100))
+            
+            if messages:
+                channel = messages[0].channel
+            else:
+                return []
+        
         messages = channel.messages
         if messages is None:
             ln = 0
         else:
             ln = len(messages)
+            
+            # If every requested message is cached, we can return them instantly.
+            if end <= ln:
+                return list(islice(messages, start, end))
         
         if (end >= ln) and (not channel.message_history_reached_end) and \
                channel.cached_permissions_for(self).can_read_message_history:
@@ -5168,13 +5934,11 @@ class Client(UserBase):
                 else:
                     raise
         
-        result = []
         messages = channel.messages
-        if (messages is not None):
-            for index in range(start, min(end, len(messages))):
-                result.append(messages[index])
+        if messages is None:
+            return []
         
-        return result
+        return list(islice(messages, start, end))
     
     async def message_iterator(self, channel, chunksize=99):
         """
@@ -5232,13 +5996,7 @@ class Client(UserBase):
         -----
         The client will be shown up as typing for 8 seconds, or till it sends a message at the respective channel.
         """
-        if isinstance(channel, ChannelTextBase):
-            channel_id = channel.id
-        else:
-            channel_id = maybe_snowflake(channel)
-            if channel_id is None:
-                raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` instance, got'
-                    f'{channel.__class__.__name__}.')
+        channel_id = _get_text_channel_id(channel)
         
         await self.http.typing(channel_id)
 
@@ -5264,13 +6022,7 @@ class Client(UserBase):
         TypeError
             If `channel` was not given neither as ``ChannelTextBase`` nor `int` instance.
         """
-        if isinstance(channel, ChannelTextBase):
-            channel_id = channel.id
-        else:
-            channel_id = maybe_snowflake(channel)
-            if channel_id is None:
-                raise TypeError(f'`channel` can be given as `{ChannelTextBase.__name__}` instance, got'
-                    f'{channel.__class__.__name__}.')
+        channel_id = _get_text_channel_id(channel)
         
         return Typer(self, channel_id, timeout)
     
@@ -5298,18 +6050,7 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(message, Message):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageRepr):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageReference):
-            channel_id = message.channel_id
-            message_id = message.message_id
-        else:
-            raise TypeError(f'`message` can be given as  `{Message.__name__}`, `{MessageRepr.__name__}` or as '
-                f'`{MessageReference.__name__}` instance, got {message!r}.')
+        channel_id, message_id, reactions = _get_message_ids(message)
         
         await self.http.reaction_add(channel_id, message_id, emoji.as_reaction)
     
@@ -5338,20 +6079,10 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(message, Message):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageRepr):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageReference):
-            channel_id = message.channel_id
-            message_id = message.message_id
-        else:
-            raise TypeError(f'`message` can be given as  `{Message.__name__}`, `{MessageRepr.__name__}` or as '
-                f'`{MessageReference.__name__}` instance, got {message!r}.')
+        channel_id, message_id, reactions = _get_message_ids(message)
         
-        if isinstance(user, (User, Client)):
+        user_type = type(user)
+        if (user_type is User) or (user_type is Client) or isinstance(user, (User, Client)):
             user_id = user.id
         else:
             user_id = maybe_snowflake(user)
@@ -5386,18 +6117,7 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(message, Message):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageRepr):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageReference):
-            channel_id = message.channel_id
-            message_id = message.message_id
-        else:
-            raise TypeError(f'`message` can be given as  `{Message.__name__}`, `{MessageRepr.__name__}` or as '
-                f'`{MessageReference.__name__}` instance, got {message!r}.')
+        channel_id, message_id, reactions = _get_message_ids(message)
         
         await self.http.reaction_delete_emoji(channel_id, message_id, emoji.as_reaction)
     
@@ -5423,18 +6143,7 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(message, Message):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageRepr):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageReference):
-            channel_id = message.channel_id
-            message_id = message.message_id
-        else:
-            raise TypeError(f'`message` can be given as  `{Message.__name__}`, `{MessageRepr.__name__}` or as '
-                f'`{MessageReference.__name__}` instance, got {message!r}.')
+        channel_id, message_id, reactions = _get_message_ids(message)
         
         await self.http.reaction_delete_own(channel_id, message_id, emoji.as_reaction)
     
@@ -5458,18 +6167,7 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(message, Message):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageRepr):
-            message_id = message.id
-            channel_id = message.channel.id
-        elif isinstance(message, MessageReference):
-            channel_id = message.channel_id
-            message_id = message.message_id
-        else:
-            raise TypeError(f'`message` can be given as  `{Message.__name__}`, `{MessageRepr.__name__}` or as '
-                f'`{MessageReference.__name__}` instance, got {message!r}.')
+        channel_id, message_id, reactions = _get_message_ids(message)
         
         await self.http.reaction_clear(channel_id, message_id)
     
@@ -5522,28 +6220,12 @@ class Client(UserBase):
             limit = 25
         else:
             if __debug__:
-                if not isinstance(limit, int):
-                    raise AssertionError(f'`limit` can be given as `None` or `int` instance, got '
-                        f'{limit.__class__.__name__}.')
-                
-                if limit < 1 or limit > 100:
-                    raise AssertionError(f'`limit` can be between in range [1:100], got `{limit!r}`.')
+                _assert_limit_1_100(limit)
         
-        if isinstance(message, Message):
-            message_id = message.id
-            channel_id = message.channel.id
-            reactions = message.reactions
-        elif isinstance(message, MessageRepr):
-            message_id = message.id
-            channel_id = message.channel.id
-            reactions = None
-        elif isinstance(message, MessageReference):
-            channel_id = message.channel_id
-            message_id = message.message_id
-            reactions = None
-        else:
-            raise TypeError(f'`message` can be given as  `{Message.__name__}`, `{MessageRepr.__name__}` or as '
-                f'`{MessageReference.__name__}` instance, got {message!r}.')
+        channel_id, message_id, reactions = _get_message_ids(message)
+        
+        after = 0 if after is None else log_time_converter(after)
+        # before = 9223372036854775807 if before is None else log_time_converter(before)
         
         if (reactions is not None):
             try:
@@ -5552,17 +6234,14 @@ class Client(UserBase):
                 return []
             
             if not line.unknown:
-                after = 0 if after is None else log_time_converter(after)
-                # before = 9223372036854775807 if before is None else log_time_converter(before)
                 users = line.filter_after(limit, after)
                 return users
         
-        data = {}
-        if limit != 25:
-            data['limit'] = limit
-        
-        if (after is not None):
-            data['after'] = log_time_converter(after)
+        # `limit` defaults to `25` and `after` to `0` at Discord's side as well, so `limit` can be always sent.
+        if after:
+            data = {'limit': limit, 'after': after}
+        else:
+            data = {'limit': limit}
         
         # if (before is not None):
         #     data['before'] = log_time_converter(before)
@@ -5606,24 +6285,9 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(message, Message):
-            message_id = message.id
-            channel_id = message.channel.id
-            reactions = message.reactions
-        elif isinstance(message, MessageRepr):
-            message_id = message.id
-            channel_id = message.channel.id
-            reactions = None
-        elif isinstance(message, MessageReference):
-            channel_id = message.channel_id
-            message_id = message.message_id
-            reactions = None
-        else:
-            raise TypeError(f'`message` can be given as  `{Message.__name__}`, `{MessageRepr.__name__}` or as '
-                f'`{MessageReference.__name__}` instance, got {message!r}.')
+        channel_id, message_id, reactions = _get_message_ids(message)
         
         if (reactions is not None):
-            reactions = message.reactions
             if not reactions:
                 return []
             
@@ -5636,25 +6300,58 @@ class Client(UserBase):
                 users = list(line)
                 return users
         
+        users = await self._reaction_users_all(channel_id, message_id, emoji.as_reaction)
+        
+        if (reactions is not None):
+            reactions._update_all_users(emoji, users)
+        
+        return users
+    
+    async def _reaction_users_all(self, channel_id, message_id, reaction):
+        """
+        Requests all the users, who reacted with the given reaction on the message. Called by
+        ``.reaction_users_all`` and by ``.reaction_load_all``.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        channel_id : `int`
+            The message's channel's identifier.
+        message_id : `int`
+            The message's identifier.
+        reaction : `str`
+            The emoji's reaction form.
+        
+        Returns
+        -------
+        users : `list` of (``Client`` or ``User``) objects
+        
+        Raises
+        ------
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        # Each page starts after the last user of the previous one, so the pages of a reaction are requested one by
+        # one.
         data = {'limit': 100, 'after': 0}
         users = []
-        reaction = emoji.as_reaction
-            
+        http_reaction_users = self.http.reaction_users
+        
         while True:
-            user_datas = await self.http.reaction_users(channel_id, message_id, reaction, data)
-            users.extend(User(user_data) for user_data in user_datas)
+            user_datas = await http_reaction_users(channel_id, message_id, reaction, data)
+            users.extend([User(user_data) for user_data in user_datas])
             
             if len(user_datas) < 100:
                 break
             
-            data['after'] = users[-1].id
-        
-        if (reactions is not None):
-            reactions._update_all_users(emoji, users)
+            # Take the last user's id from it's data, as it is the same as the created user's.
+            data['after'] = user_datas[-1]['id']
         
         return users
     
-    
     async def reaction_load_all(self, message):
         """
         Requests all the reacters for every emoji on the given message.
@@ -5682,45 +6379,34 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(message, Message):
-            message_id = message.id
-            channel_id = message.channel.id
-        else:
-            if isinstance(message, MessageRepr):
-                message_id = message.id
-                channel_id = message.channel.id
-            elif isinstance(message, MessageReference):
-                channel_id = message.channel_id
-                message_id = message.message_id
-            else:
-                raise TypeError(f'`message` can be given as  `{Message.__name__}`, `{MessageRepr.__name__}` or as '
-                    f'`{MessageReference.__name__}` instance, got {message!r}.')
-            
+        channel_id, message_id, reactions = _get_message_ids(message)
+        if reactions is None:
             message = await self.message_get(channel_id, message_id)
         
         reactions = message.reactions
         if reactions:
-            users = []
-            data = {'limit': 100}
+            emojis = [emoji for emoji, line in reactions.items() if line.unknown]
             
-            for emoji, line in reactions.items():
-                if not line.unknown:
-                    continue
+            # The reacters of different emojis do not depend on each other, so request them parallelly. A single
+            # emoji can be requested directly, without creating a task and a waiter for it.
+            if len(emojis) == 1:
+                emoji = emojis[0]
+                users = await self._reaction_users_all(channel_id, message_id, emoji.as_reaction)
+                reactions._update_all_users(emoji, users)
+            
+            elif emojis:
+                tasks = [Task(self._reaction_users_all(channel_id, message_id, emoji.as_reaction), KOKORO) for emoji
+                    in emojis]
                 
-                reaction = emoji.as_reaction
-                data['after'] = 0
+                done, pending = await WaitTillExc(tasks, KOKORO)
+                for task in pending:
+                    task.cancel()
                 
-                while True:
-                    user_datas = await self.http.reaction_users(channel_id, message_id, reaction, data)
-                    users.extend(User(user_data) for user_data in user_datas)
-                    
-                    if len(user_datas) < 100:
-                        break
-                    
-                    data['after'] = users[-1].id
+                for task in done:
+                    task.result()
                 
-                message.reactions._update_all_users(emoji, users)
-                users.clear()
+                for emoji, task in zip(emojis, tasks):
+                    reactions._update_all_users(emoji, task.result())
         
         return message
     
@@ -5750,14 +6436,7 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         data = await self.http.guild_preview(guild_id)
         return GuildPreview(data)
@@ -5788,17 +6467,11 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         
-        if isinstance(user, (User, Client)):
+        user_type = type(user)
+        if (user_type is User) or (user_type is Client) or isinstance(user, (User, Client)):
             user_id = user.id
         
         else:
@@ -5839,28 +6512,8 @@ class Client(UserBase):
         -----
         If the guild has no welcome screen enabled, will not do any request.
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
-            
-            guild = None
-        
-        
-        if (guild is None) or (GuildFeature.welcome_screen in guild.features):
-            welcome_screen_data = await self.http.welcome_screen_get(guild_id)
-            if welcome_screen_data is None:
-                welcome_screen = None
-            else:
-                welcome_screen = WelcomeScreen.from_data(welcome_screen_data)
-        else:
-            welcome_screen = None
-        
-        return welcome_screen
+        return await self._feature_gated_get(guild, GuildFeature.welcome_screen, self.http.welcome_screen_get,
+            WelcomeScreen)
     
     async def welcome_screen_edit(self, guild, *, enabled=..., description=..., welcome_channels=...):
         """
@@ -5901,14 +6554,7 @@ class Client(UserBase):
             - If `description`'s length is out of range [0:140].
             - If `welcome_channels`'s length is out of range [0:5].
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         data = {}
         
@@ -5938,18 +6584,18 @@ class Client(UserBase):
             data['description'] = description
         
         if (welcome_channels is not ...):
-            welcome_channel_datas = []
-            if welcome_channel_datas is None:
-                pass
+            if welcome_channels is None:
+                welcome_channel_datas = []
             elif isinstance(welcome_channels, WelcomeChannel):
-                welcome_channel_datas.append(welcome_channels.to_data())
+                welcome_channel_datas = [welcome_channels.to_data()]
             elif isinstance(welcome_channels, (list, tuple)):
                 if __debug__:
                     welcome_channels_ln = len(welcome_channels)
-                    if welcome_channels > 5:
+                    if welcome_channels_ln > 5:
                         raise AssertionError(f'`welcome_channels` length can be in range [0:5], got '
                             f'{welcome_channels_ln!r}; {welcome_channels!r}.')
                 
+                welcome_channel_datas = []
                 for index, welcome_channel in enumerate(welcome_channels):
                     if not isinstance(welcome_channel, WelcomeChannel):
                         raise TypeError(f'Welcome channel `{index}` was not given as `{WelcomeChannel.__name__}` '
@@ -6003,7 +6649,43 @@ class Client(UserBase):
         -----
         If the guild has no verification screen enabled, will not do any request.
         """
-        if isinstance(guild, Guild):
+        return await self._feature_gated_get(guild, GuildFeature.verification_screen,
+            self.http.verification_screen_get, VerificationScreen)
+    
+    async def _feature_gated_get(self, guild, feature, http_getter, type_):
+        """
+        Requests a guild's feature bound object, like it's welcome or verification screen. Called by
+        ``.welcome_screen_get`` and by ``.verification_screen_get``.
+        
+        If the guild is given as ``Guild`` instance and it has not the given feature, will not do any request.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        guild : ``Guild`` or `int`
+            The guild, what's object will be requested.
+        feature : ``GuildFeature``
+            The feature, what the guild should have to request the object.
+        http_getter : `coroutine function`
+            The http client's method to request the object's data with. Called with the guild's identifier.
+        type_ : `type`
+            The requested object's type. Should implement a `.from_data` class method.
+        
+        Returns
+        -------
+        obj : `None` or `type_` instance
+        
+        Raises
+        ------
+        TypeError
+            If `guild` was not given neither as ``Guild`` nor `int` instance.
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        if (type(guild) is Guild) or isinstance(guild, Guild):
             guild_id = guild.id
         
         else:
@@ -6014,16 +6696,14 @@ class Client(UserBase):
             
             guild = None
         
-        if (guild is None) or (GuildFeature.verification_screen in guild.features):
-            verification_screen_data = await self.http.verification_screen_get(guild_id)
-            if verification_screen_data is None:
-                verification_screen = None
-            else:
-                verification_screen = VerificationScreen.from_data(verification_screen_data)
-        else:
-            verification_screen = None
+        if (guild is not None) and (feature not in guild.features):
+            return None
         
-        return verification_screen
+        data = await http_getter(guild_id)
+        if data is None:
+            return None
+        
+        return type_.from_data(data)
     
     
     async def verification_screen_edit(self, guild, *, enabled=..., description=..., steps=...):
@@ -6068,14 +6748,7 @@ class Client(UserBase):
         -----
         When editing steps, `DiscordException Internal Server Error (500): 500: Internal Server Error` will be dropped.
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         data = {}
         
@@ -6166,14 +6839,7 @@ class Client(UserBase):
             - `delete_message_days` was not given as `int` instance.
             - `delete_message_days` is out of range [0:delete_message_days].
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         
         if isinstance(user, (User, Client)):
@@ -6228,14 +6894,7 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         
         if isinstance(user, (User, Client)):
@@ -6375,14 +7034,7 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         await self.http.guild_leave(guild_id)
     
@@ -6407,14 +7059,7 @@ class Client(UserBase):
         DiscordException
             If any exception was received from the Discord API.
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         await self.http.guild_delete(guild_id)
     
@@ -6732,14 +7377,7 @@ class Client(UserBase):
             - If `days` was not given as `int` instance.
             - If `days` is out of range [1:30].
         """
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as `{Guild.__name__}` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         if __debug__:
             if not isinstance(days, int):
@@ -10800,13 +11438,7 @@ class Client(UserBase):
             if application_id == 0:
                 raise AssertionError('The client\'s application is not yet synced.')
         
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as ``{Guild.__name__}`` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         data = await self.http.application_command_guild_get_all(application_id, guild_id)
         return [ApplicationCommand.from_data(application_command_data) for application_command_data in data]
@@ -10851,13 +11483,7 @@ class Client(UserBase):
             if application_id == 0:
                 raise AssertionError('The client\'s application is not yet synced.')
         
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as ``{Guild.__name__}`` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         if __debug__:
             if not isinstance(application_command, ApplicationCommand):
@@ -10910,13 +11536,7 @@ class Client(UserBase):
             if application_id == 0:
                 raise AssertionError('The client\'s application is not yet synced.')
         
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as ``{Guild.__name__}`` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         if __debug__:
             if not isinstance(new_application_command, ApplicationCommand):
@@ -10954,13 +11574,7 @@ class Client(UserBase):
             if application_id == 0:
                 raise AssertionError('The client\'s application is not yet synced.')
         
-        if isinstance(guild, Guild):
-            guild_id = guild.id
-        else:
-            guild_id = maybe_snowflake(guild)
-            if guild_id is None:
-                raise TypeError(f'`guild` can be given as ``{Guild.__name__}`` or `int` instance, got '
-                    f'{guild.__class__.__name__}.')
+        guild_id = _get_guild_id(guild)
         
         if isinstance(application_command, ApplicationCommand):
             application_command_id = application_command.id
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-__all__ = ('ClientWrapper', 'Typer', )
+__all__ = ('ClientWrapper', 'MessageAuthorFilter', 'Typer', )
 
 from math import inf
 
@@ -16,6 +16,9 @@ Client = NotImplemented
 
 USER_CHUNK_TIMEOUT = 2.5
 
+MESSAGE_COALESCE_DELAY = 0.25
+MESSAGE_COALESCE_CONTENT_LIMIT = 2000
+
 
 
 class SingleUserChunker(object):
@@ -624,9 +627,11 @@ class MultiClientMessageDeleteSequenceSharder(object):
         Task of deleting new or own messages.
     delete_old_task : `None` or ``Task``
         task of deleting other's old messages.
+    http : ``DiscordHTTPClient``
+        The respective client's http client. Stored, so the deleter does not need to look it up for every request.
     """
     __slots__ = ('can_manage_messages', 'can_read_message_history', 'client', 'delete_mass_task', 'delete_new_task',
-        'delete_old_task', )
+        'delete_old_task', 'http', )
     def __new__(cls, client, channel):
         """
         Creates a new helper instance of a multi client message sequence deleter.
@@ -649,6 +654,7 @@ class MultiClientMessageDeleteSequenceSharder(object):
         
         self = object.__new__(cls)
         self.client = client
+        self.http = client.http
         self.can_read_message_history = permissions.can_read_message_history
         self.can_manage_messages = permissions.can_manage_messages
         
@@ -659,6 +665,54 @@ class MultiClientMessageDeleteSequenceSharder(object):
         return self
     
 
+class MessageAuthorFilter(object):
+    """
+    A message filter, what accepts only the messages of the given author. Can be passed as `filter` to the message
+    delete sequence methods of ``Client``, which at that case check the author directly on the received message data,
+    without creating a ``Message`` instance for each of them.
+    
+    Attributes
+    ----------
+    author_id : `int`
+        The author's identifier, whose messages are accepted.
+    """
+    __slots__ = ('author_id', )
+    def __init__(self, author):
+        """
+        Creates a new message author filter.
+        
+        Parameters
+        ----------
+        author : ``UserBase`` instance or `int` instance
+            The author or it's identifier, whose messages should be accepted.
+        """
+        if isinstance(author, int):
+            author_id = int(author)
+        else:
+            author_id = author.id
+        
+        self.author_id = author_id
+    
+    def __call__(self, message):
+        """
+        Returns whether the given message passes the filter.
+        
+        Parameters
+        ----------
+        message : ``Message``
+            The message to check.
+        
+        Returns
+        -------
+        passed : `bool`
+        """
+        return (message.author.id == self.author_id)
+    
+    def __repr__(self):
+        """Returns the message author filter's representation."""
+        return f'<{self.__class__.__name__} author_id={self.author_id}>'
+
+
 class WaitForHandler(object):
     """
     O(n) event waiter. Added as an event handler by ``Client.wait_for``.
@@ -776,6 +830,105 @@ class Typer(object):
         self.cancel()
 
 
+class MessageCoalescer(object):
+    """
+    Collects the contents of messages sent to the same channel in a short time window and sends them as one message.
+    Used by ``Client.message_create``, when called with `coalesce=True`.
+    
+    Attributes
+    ----------
+    channel_id : `int`
+        The channel's id where the message will be sent.
+    client : ``Client``
+        The client, who sends the message.
+    contents : `list` of `str`
+        The collected contents.
+    length : `int`
+        The length of the message to send, with the line breaks between the contents.
+    timer : `None` or `Handle`
+        Sends the collected contents when the coalescing time window passes.
+    waiter : ``Future``
+        Set with the created message's data, or with the occured exception, after the request is done.
+    """
+    __slots__ = ('channel_id', 'client', 'contents', 'length', 'timer', 'waiter',)
+    
+    def __init__(self, client, channel_id):
+        """
+        Creates a new message coalescer and registers it at the client.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The client, who sends the message.
+        channel_id : `int`
+            The channel's id where the message will be sent.
+        """
+        self.client = client
+        self.channel_id = channel_id
+        self.contents = []
+        self.length = 0
+        self.waiter = Future(KOKORO)
+        self.timer = KOKORO.call_at(LOOP_TIME()+MESSAGE_COALESCE_DELAY, type(self).flush, self)
+        client._message_coalescers[channel_id] = self
+    
+    def add(self, content):
+        """
+        Adds the given content to the message, if it fits into it.
+        
+        Parameters
+        ----------
+        content : `str`
+            The content to add.
+        
+        Returns
+        -------
+        added : `bool`
+            An empty coalescer accepts any content.
+        """
+        contents = self.contents
+        if contents:
+            length = self.length+1+len(content)
+            if length > MESSAGE_COALESCE_CONTENT_LIMIT:
+                return False
+        else:
+            length = len(content)
+        
+        contents.append(content)
+        self.length = length
+        return True
+    
+    def flush(self):
+        """
+        Unregisters the coalescer from it's client and starts sending the collected contents. Called when the
+        coalescing time window passes, or when a new content does not fit into the message anymore.
+        """
+        timer = self.timer
+        if timer is None:
+            return
+        
+        self.timer = None
+        timer.cancel()
+        
+        coalescers = self.client._message_coalescers
+        if coalescers.get(self.channel_id, None) is self:
+            del coalescers[self.channel_id]
+        
+        Task(self.send(), KOKORO)
+    
+    async def send(self):
+        """
+        Sends the collected contents as one message and sets the result to ``.waiter``.
+        
+        This method is a coroutine.
+        """
+        try:
+            data = await self.client.http.message_create(self.channel_id, {'content': '\n'.join(self.contents)})
+        except BaseException as err:
+            self.waiter.set_exception_if_pending(err)
+        else:
+            self.waiter.set_result_if_pending(data)
+
+
 class ClientWrapper(object):
     """
     Wraps together more clients enabling to add the same event handlers or commands to them. Tho for that feature, you
@@ -990,7 +1143,10 @@ def maybe_snowflake(value):
         - If `value` was passed as `str` and cannot be converted to `int`.
         - If the `value` is negative or it's bit length is over 64.
     """
-    if isinstance(value, int):
+    # `int` is the most common non-object input, so check it's exact type first, which is cheaper than `isinstance`.
+    if type(value) is int:
+        pass
+    elif isinstance(value, int):
         pass
     elif isinstance(value, str):
         if value.isdigit():
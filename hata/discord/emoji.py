@@ -721,42 +721,32 @@ class reaction_mapping_line(set):
         
         Returns
         -------
-        users : `
+        users : `list` of (``User`` or ``Client``) objects
         """
         list_form = sorted(self)
         
-        after = after+1 # do not include the specified id
-        
-        bot = 0
-        top = len(list_form)
-        while True:
-            if bot<top:
-                half = (bot+top)>>1
-                if list_form[half].id<after:
-                    bot = half+1
-                else:
-                    top = half
-                continue
-            break
-        
-        index = bot
-        
-        length = len(list_form)
-        users = []
-        
-        while True:
-            if index == length:
-                break
+        # If `after` is `0`, every user is after it, so we can skip searching for the start.
+        if after:
+            after = after+1 # do not include the specified id
             
-            if limit <= 0:
+            bot = 0
+            top = len(list_form)
+            while True:
+                if bot<top:
+                    half = (bot+top)>>1
+                    if list_form[half].id<after:
+                        bot = half+1
+                    else:
+                        top = half
+                    continue
                 break
-            
-            users.append(list_form[index])
-            index += 1
-            limit -= 1
-            continue
+        else:
+            bot = 0
+        
+        if limit <= 0:
+            return []
         
-        return users
+        return list_form[bot:bot+limit]
     
     def clear(self):
         """
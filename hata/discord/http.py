@@ -1226,7 +1226,7 @@ class DiscordHTTPClient(HTTPClient):
         url : `str`
             The url to request.
         data : `Any`, Optional
-            Payload to request with.
+            Payload to request with. If given as `bytes`, then it is sent as already encoded json.
         params : `Any`, Optional
             Query parameters.
         headers : `imultidict`, Optional
@@ -1250,9 +1250,12 @@ class DiscordHTTPClient(HTTPClient):
             #normal request
             headers = self.headers.copy()
             
-            if type(data) in (dict, list):
+            data_type = type(data)
+            if data_type in (dict, list):
                 headers[CONTENT_TYPE] = 'application/json'
                 data = to_json(data)
+            elif data_type is bytes:
+                headers[CONTENT_TYPE] = 'application/json'
             
             if reason is not None:
                 headers[AUDIT_LOG_REASON] = quote(reason, safe='\ ')
@@ -1275,7 +1278,7 @@ class DiscordHTTPClient(HTTPClient):
             with handler.ctx() as lock:
                 try:
                     async with RequestCM(self._request(method, url, headers, data, params)) as response:
-                        response_data = await response.text(encoding='utf-8')
+                        response_data = await response.read()
                 except OSError as err:
                     if not try_again:
                         raise ConnectionError('Invalid adress or no connection with Discord') from err
@@ -1289,8 +1292,11 @@ class DiscordHTTPClient(HTTPClient):
                 response_headers = response.headers
                 status = response.status
                 
+                # Decode json directly from `bytes`, so the body is not decoded to `str` first.
                 if response_headers[CONTENT_TYPE] == 'application/json':
                     response_data = from_json(response_data)
+                elif (response_data is not None):
+                    response_data = response_data.decode('utf-8')
                 
                 if 199 < status < 305:
                     lock.exit(response_headers)
@@ -415,6 +415,21 @@ class MessageReference(object):
         
         return message
     
+    def _as_target(self):
+        """
+        Returns the target of a message create request, which replies on the referenced message.
+        
+        Returns
+        -------
+        channel : `None` or ``ChannelTextBase`` instance
+            The message's channel if cached.
+        channel_id : `int`
+            The message's channel's id.
+        message_id : `int`
+            The message's id.
+        """
+        return self.channel, self.channel_id, self.message_id
+    
     def __repr__(self):
         """Returns the representation of the message reference."""
         result = [
@@ -683,6 +698,22 @@ class MessageRepr(DiscordEntity):
         """
         return self.channel.guild
     
+    def _as_target(self):
+        """
+        Returns the target of a message create request, which replies on the represented message.
+        
+        Returns
+        -------
+        channel : `None` or ``ChannelTextBase`` instance
+            The message's channel if any.
+        channel_id : `int`
+            The message's channel's id.
+        message_id : `int`
+            The message's id.
+        """
+        channel = self.channel
+        return channel, channel.id, self.id
+    
     def __repr__(self):
         """Returns the message representation's reprentation."""
         return f'<{self.__class__.__name__} id={self.id}, channel={self.channel!r}>'
@@ -873,10 +904,11 @@ class Message(DiscordEntity, immortal=True):
             if author_data is None:
                 author = ZEROUSER
             else:
-                try:
-                     author_data['member'] = data['member']
-                except KeyError:
-                    pass
+                # `member` is missing at private channels, so look it up without raising.
+                member_data = data.get('member', None)
+                if (member_data is not None):
+                    author_data['member'] = member_data
+                
                 author = User(author_data, guild)
         else:
             webhook_id = int(webhook_id)
@@ -2193,7 +2225,23 @@ class Message(DiscordEntity, immortal=True):
         guild : `None` or ``Guild``
         """
         return self.channel.guild
-
+    
+    def _as_target(self):
+        """
+        Returns the target of a message create request, which replies on the message.
+        
+        Returns
+        -------
+        channel : `None` or ``ChannelTextBase`` instance
+            The message's channel if any.
+        channel_id : `int`
+            The message's channel's id.
+        message_id : `int`
+            The message's id.
+        """
+        channel = self.channel
+        return channel, channel.id, self.id
+    
     @property
     def clean_content(self):
         """
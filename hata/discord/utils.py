@@ -7,7 +7,14 @@ import random, re, sys
 from datetime import datetime
 from base64 import b64encode
 from time import time as time_now
-from json import dumps as dump_to_json, loads as from_json
+from json import dumps as dump_to_json
+
+# `orjson` decodes json notably faster, so use it if available. It accepts `bytes` as well, just like the built-in
+# `json` module.
+try:
+    from orjson import loads as from_json
+except ImportError:
+    from json import loads as from_json
 
 try:
     from dateutil.relativedelta import relativedelta
@@ -80,6 +80,7 @@ setup(
                 ],
         'cpythonspeedups': [
             'cchardet',
+            'orjson',
                 ],
             },
         )